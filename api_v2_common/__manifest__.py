@@ -0,0 +1,14 @@
+{
+    "name": "REST API v2 – Common",
+    "version": "18.0.1.0.0",
+    "author": "Yusuf Khan",
+    "category": "Technical",
+    "summary": "Shared helpers for the /api/v2 REST controllers",
+    "depends": ["base"],
+    "data": [
+        "security/ir.model.access.csv",
+        "data/cron.xml",
+    ],
+    "installable": True,
+    "application": False,
+}
@@ -0,0 +1,2 @@
+from . import job_api
+from . import metrics_api
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.api_v2_common.tools import (
+    instrument, json_response, rate_limit, register_serializer, serialize,
+)
+from odoo.addons.api_v2_common.tools.lines import _is_id
+
+_logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('api.job', {
+    'id': 'id',
+    'operation': 'operation',
+    'state': 'state',
+    'total': 'total',
+    'processed': 'processed',
+    'failed': 'failed',
+    'errors': 'errors',
+    'message': 'message',
+    'created_on': 'create_date',
+    'done_on': 'date_done',
+})
+
+
+class JobRestAPI(http.Controller):
+
+    # ===================================================
+    # POST → Queue a Background Job
+    # ===================================================
+    @http.route('/api/v2/jobs', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def create_job(self, **kwargs):
+        try:
+            payload = json.loads(request.httprequest.data or '{}')
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            return request.make_json_response(
+                {'status': 'error', 'message': 'A JSON object is required'},
+                status=400
+            )
+
+        Job = request.env['api.job'].sudo()
+        operations = Job._fields['operation'].get_values(request.env)
+        operation = payload.get('operation')
+        if operation not in operations:
+            return request.make_json_response(
+                {'status': 'error', 'message': f"operation must be one of {', '.join(operations)}"},
+                status=400
+            )
+
+        job_payload = payload.get('payload')
+        ids = job_payload.get('ids') if isinstance(job_payload, dict) else None
+        if not isinstance(ids, list) or not ids or not all(_is_id(i) for i in ids):
+            return request.make_json_response(
+                {'status': 'error', 'message': 'payload.ids must be a non-empty list of integers'},
+                status=400
+            )
+
+        job = Job.create({'operation': operation, 'payload': {'ids': ids}})
+
+        return request.make_json_response({
+            'status': 'success',
+            'id': job.id,
+            'state': job.state,
+            'url': f'/api/v2/jobs/{job.id}',
+        }, status=202)
+
+    # ===================================================
+    # GET → Job Progress and Results
+    # ===================================================
+    @http.route('/api/v2/jobs/<int:job_id>', type='http', auth='user',
+                methods=['GET', 'HEAD'], csrf=False)
+    @instrument
+    def get_job(self, job_id, **kwargs):
+        job = request.env['api.job'].sudo().browse(job_id).exists()
+
+        # Jobs are private to whoever queued them
+        found = job and (job.create_uid == request.env.user or request.env.user._is_system())
+
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if found else 404)
+
+        if not found:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Job not found'},
+                status=404
+            )
+
+        return json_response({'status': 'success', 'data': serialize('api.job', job)[0]})
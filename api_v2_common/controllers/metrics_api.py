@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.api_v2_common.tools import flush_metrics
+
+# (metric, api.endpoint.stat field, type, help)
+METRICS = [
+    ('api_v2_requests_total', 'count', 'counter',
+     'Requests served by the /api/v2 endpoints.'),
+    ('api_v2_request_duration_seconds_total', 'wall_time', 'counter',
+     'Wall time spent serving the requests.'),
+    ('api_v2_sql_queries_total', 'sql_count', 'counter',
+     'SQL queries run by the requests.'),
+    ('api_v2_sql_duration_seconds_total', 'sql_time', 'counter',
+     'Time spent in SQL by the requests.'),
+    ('api_v2_response_bytes_total', 'response_bytes', 'counter',
+     'Size of the response bodies.'),
+]
+
+
+class MetricsRestAPI(http.Controller):
+
+    # ===================================================
+    # GET → Endpoint Statistics (PROMETHEUS TEXT FORMAT)
+    # ===================================================
+    @http.route('/api/v2/_metrics', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    def get_metrics(self, **kwargs):
+        if not request.env.user._is_system():
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Access denied'},
+                status=403
+            )
+
+        # Include this worker's pending samples
+        flush_metrics(request.env.registry)
+        stats = request.env['api.endpoint.stat'].sudo().search_read(
+            [], ['endpoint', 'method', 'status'] + [field for _name, field, _type, _help in METRICS],
+        )
+
+        lines = []
+        for name, field, metric_type, help_text in METRICS:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}']
+            lines += [
+                f'{name}{{endpoint="{s["endpoint"]}",method="{s["method"]}",status="{s["status"]}"}} {s[field]}'
+                for s in stats
+            ]
+
+        return request.make_response(
+            '\n'.join(lines) + '\n',
+            headers=[('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')]
+        )
@@ -0,0 +1,5 @@
+from . import api_tombstone
+from . import api_sync_mixin
+from . import api_job
+from . import api_endpoint_stat
+from . import api_rate_bucket
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields
+
+
+class ApiEndpointStat(models.Model):
+    """Cumulative /api/v2 request statistics, one row per endpoint, method
+    and status. Written by :func:`~odoo.addons.api_v2_common.tools.metrics.flush_metrics`
+    with an UPSERT, read by ``/api/v2/_metrics``.
+    """
+    _name = 'api.endpoint.stat'
+    _description = 'REST API Endpoint Statistics'
+    _order = 'endpoint, method, status'
+    _log_access = False
+
+    endpoint = fields.Char(required=True)
+    method = fields.Char(required=True)
+    status = fields.Integer(required=True)
+    count = fields.Integer()
+    wall_time = fields.Float(string="Wall Time (s)")
+    # Floats: cumulative totals outgrow a 32-bit integer column
+    sql_count = fields.Float(string="SQL Queries")
+    sql_time = fields.Float(string="SQL Time (s)")
+    response_bytes = fields.Float()
+
+    _sql_constraints = [
+        ('endpoint_method_status_uniq', 'unique(endpoint, method, status)',
+         'Statistics are kept once per endpoint, method and status.'),
+    ]
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from odoo import models, fields, api
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+# Records handled per cron call (one transaction)
+JOB_CHUNK_SIZE = 50
+
+
+class ApiJob(models.Model):
+    """Long-running /api/v2 operation, run in chunks by the job cron.
+
+    Modules add their operations with ``selection_add`` on ``operation`` and
+    a ``_run_<operation>(ids)`` method that processes one chunk of record ids
+    and returns ``{id: error message}`` for the ones that failed.
+    """
+    _name = 'api.job'
+    _description = 'REST API Background Job'
+    _order = 'id desc'
+
+    operation = fields.Selection([], required=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], default='pending', required=True, index=True)
+    payload = fields.Json(required=True)
+    total = fields.Integer()
+    processed = fields.Integer()
+    failed = fields.Integer()
+    errors = fields.Json(default=list)
+    message = fields.Text(help="Why the whole job failed")
+    date_done = fields.Datetime()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            vals.setdefault('total', len(vals['payload']['ids']))
+        jobs = super().create(vals_list)
+        self.env.ref('api_v2_common.ir_cron_api_job_worker')._trigger()
+        return jobs
+
+    # -------------------------------------------------
+    # WORKER
+    # -------------------------------------------------
+    @api.model
+    def _cron_run_jobs(self):
+        job = self._acquire_job()
+        if job:
+            job._run_chunk()
+
+        remaining = self.search_count([('state', 'in', ('pending', 'running'))])
+        self.env['ir.cron']._notify_progress(done=1 if job else 0, remaining=remaining)
+
+    @api.model
+    def _acquire_job(self):
+        # SKIP LOCKED: several cron workers can share the queue
+        self.env.cr.execute(SQL(
+            """
+            SELECT id FROM api_job
+             WHERE state IN ('pending', 'running')
+          ORDER BY id
+             LIMIT 1
+               FOR UPDATE SKIP LOCKED
+            """
+        ))
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    def _run_chunk(self):
+        self.ensure_one()
+        ids = self.payload['ids'][self.processed:self.processed + JOB_CHUNK_SIZE]
+
+        try:
+            with self.env.cr.savepoint():
+                errors = getattr(self, f'_run_{self.operation}')(ids) if ids else {}
+        except Exception as e:
+            _logger.exception("API job %s (%s) failed", self.id, self.operation)
+            self.write({'state': 'failed', 'message': str(e), 'date_done': fields.Datetime.now()})
+            return
+
+        processed = self.processed + len(ids)
+        vals = {
+            'state': 'done' if processed >= self.total else 'running',
+            'processed': processed,
+        }
+        if errors:
+            vals['failed'] = self.failed + len(errors)
+            vals['errors'] = (self.errors or []) + [
+                {'id': record_id, 'message': message} for record_id, message in errors.items()
+            ]
+        if vals['state'] == 'done':
+            vals['date_done'] = fields.Datetime.now()
+        self.write(vals)
+
+    def _browse_payload_ids(self, model, ids):
+        """``ids`` of ``model`` → ``(records, {missing id: error message})``."""
+        records = self.env[model].browse(ids).exists()
+        found = set(records.ids)
+        return records, {i: 'Record not found' for i in ids if i not in found}
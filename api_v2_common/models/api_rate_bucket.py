@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import models, fields, api
+
+
+class ApiRateBucket(models.Model):
+    """Token bucket of one user on one /api/v2 endpoint, shared by all
+    workers. Maintained with a single UPSERT by
+    :func:`~odoo.addons.api_v2_common.tools.ratelimit.rate_limit`.
+    """
+    _name = 'api.rate.bucket'
+    _description = 'REST API Rate Limit Bucket'
+    _log_access = False
+
+    user_id = fields.Many2one('res.users', required=True, ondelete='cascade')
+    endpoint = fields.Char(required=True)
+    tokens = fields.Float()
+    allowed = fields.Boolean(help="Whether the last call was let through")
+    updated_at = fields.Datetime()
+
+    _sql_constraints = [
+        ('user_endpoint_uniq', 'unique(user_id, endpoint)',
+         'One bucket per user and endpoint.'),
+    ]
+
+    @api.autovacuum
+    def _gc_idle_buckets(self):
+        # An idle bucket is full again: dropping it changes nothing
+        limit = fields.Datetime.now() - timedelta(days=1)
+        self.search([('updated_at', '<', limit)]).unlink()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+from odoo.exceptions import MissingError
+from odoo.tools import create_index, ormcache
+
+
+class ApiSyncMixin(models.AbstractModel):
+    """Make a model usable by the ``updated_since`` / ``cursor`` API feeds.
+
+    Adds a ``(write_date, id)`` index for the change scan and records a
+    tombstone for every deleted record. Models list the column tuples of the
+    filters their collection endpoint serves in ``_api_filter_indexes``.
+    Models split into several collections (invoices and bills) name the
+    field telling them apart in ``_api_scope_field``; it is kept on the
+    tombstones so that each feed only reports its own deletions.
+
+    Also caches the ``name`` → id lookups of the single-resource endpoints,
+    see :meth:`_api_resolve_name`.
+    """
+    _name = 'api.sync.mixin'
+    _description = 'REST API Incremental Sync Mixin'
+
+    _api_filter_indexes = []
+    _api_scope_field = None
+
+    def _auto_init(self):
+        res = super()._auto_init()
+        if self._auto:
+            create_index(
+                self.env.cr,
+                f'{self._table}_write_date_id_index',
+                self._table,
+                ['write_date', 'id'],
+            )
+            for columns in self._api_filter_indexes:
+                create_index(
+                    self.env.cr,
+                    f"{self._table}_{'_'.join(columns)}_index",
+                    self._table,
+                    list(columns),
+                )
+        return res
+
+    def unlink(self):
+        tombstones = [{
+            'model': self._name,
+            'res_id': record.id,
+            'scope': record[self._api_scope_field] if self._api_scope_field else False,
+        } for record in self]
+        res = super().unlink()
+        if tombstones:
+            self.env['api.tombstone'].sudo().create(tombstones)
+        return res
+
+    # -------------------------------------------------
+    # NAME → ID RESOLUTION
+    # -------------------------------------------------
+    @api.model
+    def _api_name_domain(self, name):
+        return [('name', '=', name)]
+
+    @api.model
+    @ormcache('name')
+    def _api_id_for_name(self, name):
+        # Raising keeps misses out of the cache: a record may get this name later
+        record_id = self.sudo().search(self._api_name_domain(name), limit=1).id
+        if not record_id:
+            raise MissingError(name)
+        return record_id
+
+    @api.model
+    def _api_resolve_name(self, name):
+        """Return the record named ``name`` (or an empty recordset).
+
+        The id comes from a bounded LRU cache (per model). The cache is
+        never invalidated, as clearing it would clear the whole registry
+        cache on every worker: a hit is checked against the record instead
+        (whose fields are then already loaded for the response), and a stale
+        one (renamed or deleted record) falls back to a search.
+        """
+        try:
+            record = self.browse(self._api_id_for_name(name))
+        except MissingError:
+            return self.browse()
+
+        try:
+            if record.name == name:
+                return record
+        except MissingError:
+            pass
+
+        # Stale entry (old name of a renamed record): costs this one search
+        return self.search(self._api_name_domain(name), limit=1)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import models, fields, api
+
+# Deletions older than this are no longer reported to delta syncs
+TOMBSTONE_RETENTION_DAYS = 90
+
+
+class ApiTombstone(models.Model):
+    _name = 'api.tombstone'
+    _description = 'REST API Deleted Record'
+    _order = 'deleted_at, id'
+    _log_access = False
+
+    model = fields.Char(required=True, index=True)
+    res_id = fields.Integer(string="Record ID", required=True)
+    scope = fields.Char(help="Value of the model's _api_scope_field, to tell its collections apart")
+    deleted_at = fields.Datetime(required=True, default=fields.Datetime.now, index=True)
+
+    @api.autovacuum
+    def _gc_tombstones(self):
+        limit = fields.Datetime.now() - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        self.search([('deleted_at', '<', limit)]).unlink()
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import json
+
+from odoo.tests import HttpCase
+
+
+class ApiHttpCase(HttpCase):
+    """Base class of the /api/v2 route tests: requests are sent as ``admin``."""
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate('admin', 'admin')
+
+    def api(self, method, path, payload=None, params=None, headers=None):
+        """Send a ``method`` request to ``path``, with ``payload`` as JSON body."""
+        return self.opener.request(
+            method,
+            self.base_url() + path,
+            params=params,
+            data=json.dumps(payload) if payload is not None else None,
+            headers={'Content-Type': 'application/json', **(headers or {})},
+            allow_redirects=False,
+            timeout=30,
+        )
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import new_test_user, tagged
+
+from odoo.addons.api_v2_common.tests.common import ApiHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestCommonRoutes(ApiHttpCase):
+
+    def test_create_job_validation(self):
+        response = self.api('POST', '/api/v2/jobs', ['not', 'an', 'object'])
+        self.assertEqual(response.status_code, 400)
+
+        response = self.api('POST', '/api/v2/jobs', {'operation': 'no_such_operation', 'payload': {'ids': [1]}})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['status'], 'error')
+
+    def test_get_job_not_found(self):
+        self.assertEqual(self.api('GET', '/api/v2/jobs/999999999').status_code, 404)
+        self.assertEqual(self.api('HEAD', '/api/v2/jobs/999999999').status_code, 404)
+
+    def test_rate_limit(self):
+        # /api/v2/jobs allows bursts of 5 calls; rejected payloads count too
+        for _i in range(5):
+            self.assertEqual(self.api('POST', '/api/v2/jobs', {}).status_code, 400)
+
+        response = self.api('POST', '/api/v2/jobs', {})
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response.headers['Retry-After']), 1)
+
+    def test_metrics(self):
+        self.api('POST', '/api/v2/jobs', {})
+
+        response = self.api('GET', '/api/v2/_metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers['Content-Type'].startswith('text/plain'))
+        self.assertIn('# TYPE api_v2_requests_total counter', response.text)
+        self.assertIn(
+            'api_v2_requests_total{endpoint="JobRestAPI.create_job",method="POST",status="400"}',
+            response.text,
+        )
+
+    def test_metrics_require_admin(self):
+        new_test_user(self.env, login='api_metrics_user', password='api_metrics_user')
+        self.authenticate('api_metrics_user', 'api_metrics_user')
+
+        self.assertEqual(self.api('GET', '/api/v2/_metrics').status_code, 403)
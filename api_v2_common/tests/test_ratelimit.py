@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from contextlib import ExitStack
+
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.api_v2_common.tools.ratelimit import _acquire_slot, _slot_keys
+
+
+@tagged('post_install', '-at_install')
+class TestConcurrencySlots(TransactionCase):
+
+    def test_slots_are_per_endpoint(self):
+        forecast = _slot_keys('SubscriptionRestAPI.get_forecast', 1)
+        sales = _slot_keys('SaleOrderRestAPI.get_sales', 2)
+        self.assertFalse(set(forecast) & set(sales))
+
+        uid = self.env.uid
+        with ExitStack() as stack:
+            # One cursor per concurrent request: advisory locks are re-entrant
+            # within a session
+            crs = [stack.enter_context(self.registry.cursor()) for _ in range(4)]
+
+            # A running forecast call does not take a collection slot
+            self.assertTrue(_acquire_slot(crs[0], uid, forecast))
+            self.assertTrue(_acquire_slot(crs[1], uid, sales))
+            self.assertTrue(_acquire_slot(crs[2], uid, sales))
+            # ... and every cap holds on its own
+            self.assertFalse(_acquire_slot(crs[3], uid, sales))
+            self.assertFalse(_acquire_slot(crs[3], uid, forecast))
+            self.assertTrue(_acquire_slot(crs[3], uid + 1, sales))
@@ -0,0 +1,10 @@
+from .conditional import get_validators, not_modified_response, set_validators
+from .filters import parse_filters
+from .lines import prepare_line_commands
+from .metrics import flush_metrics, instrument
+from .ratelimit import rate_limit
+from .resolver import resolve_record
+from .sync import count_collection, search_collection
+from .serializer import (
+    Field, Many, json_response, parse_fieldset, register_serializer, serialize,
+)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Conditional GET (ETag / Last-Modified) for single-resource endpoints."""
+
+import hashlib
+from datetime import timezone
+
+from odoo.http import request
+from odoo.tools import SQL
+
+
+def get_validators(record, lines_field=None, keys=None):
+    """Return ``(etag, last_modified)`` for ``record`` and its lines.
+
+    One aggregate query over the header row and its line table: the weak
+    ETag changes whenever the header or any line is written, and the line
+    count catches deleted lines. ``last_modified`` is an aware UTC datetime.
+    ``keys`` (see ``parse_fieldset``) makes each sparse fieldset of the
+    record a representation with its own ETag.
+    """
+    record.ensure_one()
+    record.flush_recordset(['write_date'])
+
+    if lines_field:
+        field = record._fields[lines_field]
+        Lines = record.env[field.comodel_name]
+        Lines.flush_model(['write_date', field.inverse_name])
+        query = SQL(
+            """
+            SELECT head.write_date, MAX(line.write_date), COUNT(line.id)
+              FROM %(head)s head
+         LEFT JOIN %(lines)s line ON line.%(fk)s = head.id
+             WHERE head.id = %(id)s
+          GROUP BY head.id
+            """,
+            head=SQL.identifier(record._table),
+            lines=SQL.identifier(Lines._table),
+            fk=SQL.identifier(field.inverse_name),
+            id=record.id,
+        )
+    else:
+        query = SQL(
+            "SELECT write_date, NULL, 0 FROM %(head)s WHERE id = %(id)s",
+            head=SQL.identifier(record._table),
+            id=record.id,
+        )
+
+    record.env.cr.execute(query)
+    head_date, lines_date, line_count = record.env.cr.fetchone()
+
+    last_modified = max(d for d in (head_date, lines_date) if d)
+    fieldset = '' if keys is None else f",{'|'.join(keys)}"
+    digest = hashlib.sha1(
+        f"{record._name},{record.id},{head_date},{lines_date},{line_count}{fieldset}".encode()
+    ).hexdigest()[:20]
+
+    return digest, last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+
+
+def not_modified_response(etag, last_modified):
+    """Return a 304 response when the client copy is still fresh, else None.
+
+    ``If-None-Match`` wins over ``If-Modified-Since`` (RFC 9110 13.2.2).
+    """
+    httprequest = request.httprequest
+
+    if httprequest.if_none_match:
+        fresh = httprequest.if_none_match.contains_weak(etag)
+    elif httprequest.if_modified_since:
+        fresh = last_modified <= httprequest.if_modified_since
+    else:
+        fresh = False
+
+    if not fresh:
+        return None
+
+    return set_validators(request.make_response('', status=304), etag, last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    return response
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Query parameters → search domain for the /api/v2 collections.
+
+Each controller whitelists what can be filtered and sorted::
+
+    SALE_FILTERS = {
+        'state': ('state', 'in'),
+        'partner_id': ('partner_id', 'in'),
+        'date_from': ('date_order', '>='),
+        'date_to': ('date_order', '<='),
+    }
+    SALE_ORDER_FIELDS = ('id', 'name', 'date_order', 'amount_total')
+
+Anything else in the query string is ignored, and values are converted to
+the type of their field, so no raw client input ends up in the domain.
+"""
+
+from datetime import timedelta
+
+from odoo import fields
+
+
+def _convert(model, field, param, value):
+    try:
+        if field.type in ('many2one', 'integer') or field.name == 'id':
+            return int(value)
+        if field.type == 'date':
+            return fields.Date.to_date(value)
+        if field.type == 'datetime':
+            return fields.Datetime.to_datetime(value)
+    except ValueError:
+        raise ValueError(f"Invalid value {value!r} for {param}")
+    if field.type == 'selection' and value not in field.get_values(model.env):
+        raise ValueError(f"Invalid value {value!r} for {param}")
+    return value
+
+
+def parse_filters(model, params, filters, order_fields=()):
+    """Return ``(domain, order)`` for the query ``params``.
+
+    ``in`` filters take a comma-separated list (``?state=draft,sent``). A
+    date given to a ``<=`` filter on a datetime field includes that whole
+    day. ``order`` is ``field [asc|desc]``, comma-separated, restricted to
+    ``order_fields``. Raises ``ValueError`` on invalid values.
+    """
+    domain = []
+    for param, (fname, operator) in filters.items():
+        raw = params.get(param)
+        if not raw:
+            continue
+        field = model._fields[fname]
+
+        if operator == 'in':
+            values = [v.strip() for v in raw.split(',') if v.strip()]
+            domain.append((fname, 'in', [_convert(model, field, param, v) for v in values]))
+            continue
+
+        value = _convert(model, field, param, raw.strip())
+        if field.type == 'datetime' and operator == '<=' and len(raw.strip()) == 10:
+            operator, value = '<', value + timedelta(days=1)
+        domain.append((fname, operator, value))
+
+    order = None
+    if params.get('order'):
+        terms = []
+        for term in params['order'].split(','):
+            fname, _sep, direction = term.strip().partition(' ')
+            direction = direction.strip().lower() or 'asc'
+            if fname not in order_fields or direction not in ('asc', 'desc'):
+                raise ValueError(f"Cannot order by {term.strip()!r}")
+            terms.append(f"{fname} {direction}")
+        order = ', '.join(terms)
+
+    return domain, order
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Line diffs of the PUT endpoints → one x2many command list."""
+
+from odoo.fields import Command
+
+
+def _is_id(value):
+    # bool is a subclass of int: true/false are not record ids
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def prepare_line_commands(record, lines_field, payload, update_vals, create_vals,
+                          keys=('update_lines', 'new_lines', 'delete_lines'), id_key='line_id'):
+    """Validate the line diff in ``payload`` against ``record`` and return
+    ``(commands, error)``, ``error`` being a message for a 400 or ``None``.
+
+    ``update_vals(line)`` and ``create_vals(line, product)`` map one payload
+    entry to field values; ``None`` values are dropped, so omitted keys keep
+    their current value (or the field default) instead of being cleared.
+
+    The lines of ``record`` are read once and ownership is checked with set
+    operations; the products of the new lines are fetched in one query. The
+    caller applies everything with a single ``write``.
+    """
+    update_key, create_key, delete_key = keys
+    updates = payload.get(update_key) or []
+    creates = payload.get(create_key) or []
+    deletes = payload.get(delete_key) or []
+
+    if not all(isinstance(line, dict) and _is_id(line.get(id_key)) for line in updates):
+        return None, f"Each entry of {update_key} needs an integer {id_key}"
+    if not all(isinstance(line, dict) and _is_id(line.get('product_id')) for line in creates):
+        return None, f"Each entry of {create_key} needs an integer product_id"
+    if not all(_is_id(line_id) for line_id in deletes):
+        return None, f"{delete_key} must be a list of integers"
+
+    update_ids = [line[id_key] for line in updates]
+    existing = set(record[lines_field].ids)
+
+    foreign = (set(update_ids) | set(deletes)) - existing
+    if foreign:
+        return None, f"Lines {sorted(foreign)} do not belong to {record.display_name}"
+    if len(set(update_ids)) != len(update_ids):
+        return None, f"Lines can only appear once in {update_key}"
+    conflicting = set(update_ids) & set(deletes)
+    if conflicting:
+        return None, f"Lines {sorted(conflicting)} are both updated and deleted"
+
+    product_ids = {line['product_id'] for line in creates}
+    products = record.env['product.product'].browse(product_ids).exists()
+    missing = product_ids - set(products.ids)
+    if missing:
+        return None, f"Invalid product_id {sorted(missing)}"
+    products_by_id = {product.id: product for product in products}
+
+    commands = []
+    for line in updates:
+        vals = {k: v for k, v in update_vals(line).items() if v is not None}
+        if vals:
+            commands.append(Command.update(line[id_key], vals))
+    for line in creates:
+        vals = create_vals(line, products_by_id[line['product_id']])
+        commands.append(Command.create({k: v for k, v in vals.items() if v is not None}))
+    commands += [Command.delete(line_id) for line_id in deletes]
+    return commands, None
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Latency / SQL / size instrumentation of the /api/v2 endpoints.
+
+``@instrument`` goes right under ``@http.route``. Every call appends one
+sample to a per-database, in-process ring buffer; the buffer is aggregated
+and added to the ``api.endpoint.stat`` table every ``FLUSH_INTERVAL``
+seconds (or when ``FLUSH_SIZE`` samples are waiting), on its own cursor so
+that a rolled back request still counts.
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from odoo.http import request
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+RING_SIZE = 10000
+FLUSH_SIZE = 1000
+FLUSH_INTERVAL = 30
+
+_lock = threading.Lock()
+_buffers = defaultdict(lambda: deque(maxlen=RING_SIZE))
+_last_flush = defaultdict(float)
+
+
+def _status_and_size(response):
+    size = response.content_length
+    if size is None and not response.is_streamed:
+        size = len(response.get_data())
+    return response.status_code, size or 0
+
+
+def instrument(func):
+    """Record wall time, SQL query count and time, response size and status
+    of every call to the decorated route."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        env = request.env
+        thread = threading.current_thread()
+        queries = env.cr.sql_log_count
+        query_time = getattr(thread, 'query_time', 0.0)
+        start = time.perf_counter()
+        status, size = 500, 0
+        try:
+            response = func(self, *args, **kwargs)
+            status, size = _status_and_size(response)
+            return response
+        finally:
+            _record(env.registry, (
+                func.__qualname__,
+                request.httprequest.method,
+                status,
+                time.perf_counter() - start,
+                env.cr.sql_log_count - queries,
+                getattr(thread, 'query_time', 0.0) - query_time,
+                size,
+            ))
+
+    return wrapper
+
+
+def _record(registry, sample):
+    with _lock:
+        buffer = _buffers[registry.db_name]
+        buffer.append(sample)
+        due = len(buffer) >= FLUSH_SIZE or time.monotonic() - _last_flush[registry.db_name] > FLUSH_INTERVAL
+    if due:
+        flush_metrics(registry)
+
+
+def flush_metrics(registry):
+    """Add the buffered samples of ``registry``'s database to the stats table."""
+    with _lock:
+        buffer = _buffers[registry.db_name]
+        samples = list(buffer)
+        buffer.clear()
+        _last_flush[registry.db_name] = time.monotonic()
+    if not samples:
+        return
+
+    totals = defaultdict(lambda: [0, 0.0, 0, 0.0, 0])
+    for endpoint, method, status, wall_time, sql_count, sql_time, size in samples:
+        total = totals[endpoint, method, status]
+        total[0] += 1
+        total[1] += wall_time
+        total[2] += sql_count
+        total[3] += sql_time
+        total[4] += size
+
+    values = SQL(", ").join(
+        SQL("(%s, %s, %s, %s, %s, %s, %s, %s)", *key, *total)
+        for key, total in totals.items()
+    )
+    try:
+        with registry.cursor() as cr:
+            cr.execute(SQL(
+                """
+                INSERT INTO api_endpoint_stat
+                       (endpoint, method, status, count, wall_time, sql_count, sql_time, response_bytes)
+                VALUES %s
+                ON CONFLICT (endpoint, method, status) DO UPDATE
+                   SET count = api_endpoint_stat.count + EXCLUDED.count,
+                       wall_time = api_endpoint_stat.wall_time + EXCLUDED.wall_time,
+                       sql_count = api_endpoint_stat.sql_count + EXCLUDED.sql_count,
+                       sql_time = api_endpoint_stat.sql_time + EXCLUDED.sql_time,
+                       response_bytes = api_endpoint_stat.response_bytes + EXCLUDED.response_bytes
+                """,
+                values,
+            ))
+    except Exception:
+        _logger.warning("Could not flush %s API metric samples", len(samples), exc_info=True)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Per user and endpoint rate limiting of the /api/v2 routes.
+
+``@rate_limit`` goes under ``@instrument`` (so rejected calls show up in the
+metrics). Calls over the limit get a ``429`` with ``Retry-After``.
+"""
+
+import functools
+import math
+import zlib
+
+from odoo.http import request
+from odoo.tools import SQL
+
+# Namespace of the advisory locks used as concurrency slots
+CONCURRENCY_LOCK_PREFIX = 'api2-slot'
+
+
+def _take_token(registry, user_id, endpoint, rate, burst):
+    """Refill the bucket of ``user_id`` on ``endpoint`` and take one token.
+
+    One UPSERT on its own cursor, committed at once: the row is shared by all
+    workers and never stays locked for the length of a request. Returns
+    ``(allowed, tokens)``.
+    """
+    now = SQL("(now() AT TIME ZONE 'UTC')")
+    refilled = SQL(
+        "LEAST(%s, bucket.tokens + EXTRACT(EPOCH FROM %s - bucket.updated_at) * %s)",
+        burst, now, rate,
+    )
+    with registry.cursor() as cr:
+        cr.execute(SQL(
+            """
+            INSERT INTO api_rate_bucket AS bucket (user_id, endpoint, tokens, allowed, updated_at)
+            VALUES (%(user_id)s, %(endpoint)s, %(burst)s - 1, TRUE, %(now)s)
+            ON CONFLICT (user_id, endpoint) DO UPDATE
+               SET tokens = CASE WHEN %(refilled)s >= 1 THEN %(refilled)s - 1 ELSE %(refilled)s END,
+                   allowed = %(refilled)s >= 1,
+                   updated_at = %(now)s
+            RETURNING allowed, tokens
+            """,
+            user_id=user_id, endpoint=endpoint, burst=burst, now=now, refilled=refilled,
+        ))
+        return cr.fetchone()
+
+
+def _slot_keys(endpoint, concurrency):
+    """Advisory lock key (a signed int4) of each concurrency slot of
+    ``endpoint``: every endpoint has its own slots."""
+    keys = []
+    for slot in range(concurrency):
+        key = zlib.crc32(f"{CONCURRENCY_LOCK_PREFIX}:{endpoint}:{slot}".encode())
+        keys.append(key - (1 << 32) if key >= 1 << 31 else key)
+    return keys
+
+
+def _acquire_slot(cr, user_id, slot_keys):
+    """Take one of the slots ``slot_keys`` for ``user_id``.
+
+    Slots are transaction-level advisory locks on the request cursor: shared
+    by all workers and released when the request ends, whatever happens.
+    """
+    cr.execute(SQL(
+        """
+        SELECT key FROM unnest(%s::integer[]) AS key
+         WHERE pg_try_advisory_xact_lock(key, %s)
+         LIMIT 1
+        """,
+        slot_keys, user_id,
+    ))
+    return bool(cr.fetchone())
+
+
+def _too_many_requests(message, retry_after):
+    return request.make_json_response(
+        {'status': 'error', 'message': message},
+        headers=[('Retry-After', str(retry_after))],
+        status=429
+    )
+
+
+def rate_limit(rate=1.0, burst=10, concurrency=None):
+    """Allow ``rate`` calls per second per user to the decorated route, with
+    bursts of up to ``burst`` calls, and at most ``concurrency`` of them at
+    the same time (for the expensive endpoints)."""
+
+    def decorator(func):
+        endpoint = func.__qualname__
+        slot_keys = _slot_keys(endpoint, concurrency) if concurrency else None
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            env = request.env
+            allowed, tokens = _take_token(env.registry, env.uid, endpoint, rate, burst)
+            if not allowed:
+                return _too_many_requests(
+                    'Rate limit exceeded',
+                    max(1, math.ceil((1 - tokens) / rate)),
+                )
+            if slot_keys and not _acquire_slot(env.cr, env.uid, slot_keys):
+                return _too_many_requests('Too many concurrent requests', 1)
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
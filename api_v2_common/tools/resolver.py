@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""``<id_or_name>`` path segments → record, for the single-resource endpoints."""
+
+
+def resolve_record(model, identifier):
+    """Return the record of ``model`` designated by ``identifier``, or an
+    empty recordset.
+
+    ``id:42`` and ``name:SO042`` are explicit. Without a prefix a numeric
+    identifier is tried as an id first, then as a name, as before; the
+    prefixes exist for purely numeric names. Name lookups go through the
+    cache of ``api.sync.mixin``.
+    """
+    identifier = str(identifier)
+    kind, sep, value = identifier.partition(':')
+
+    if sep and kind == 'id':
+        return model.browse(int(value)).exists() if value.isdigit() else model.browse()
+    if sep and kind == 'name':
+        return model._api_resolve_name(value)
+
+    if identifier.isdigit():
+        record = model.browse(int(identifier)).exists()
+        if record:
+            return record
+    return model._api_resolve_name(identifier)
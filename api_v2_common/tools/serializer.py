@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Declarative serializers for the /api/v2 payloads.
+
+A serializer maps output keys to dotted field paths::
+
+    register_serializer('sale.order', {
+        'id': 'id',
+        'customer': Field('partner_id.name', empty=None),
+        'lines': Many('order_line', 'sale.order.line'),
+    })
+
+The paths are compiled once into a field tree. Serializing a recordset then
+costs one ``read()`` on the records plus one ``read()`` per related model
+(a ``search_read`` for the lines of a one2many), whatever the number of
+records, instead of one lazy load per record.
+"""
+
+import gzip
+import json
+from collections import defaultdict
+
+from werkzeug.datastructures import Headers
+
+from odoo.http import request
+from odoo.tools import date_utils
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Smaller bodies fit in one packet: compressing them only costs CPU
+COMPRESS_MIN_SIZE = 1400
+
+_serializers = {}
+
+
+class Field:
+    """A value read from a dotted ``path``.
+
+    ``empty`` is returned when a relation along the path is not set (the ORM
+    gives ``False`` there, the historical payloads sometimes ``None``), and
+    ``convert`` is applied to the value otherwise.
+    """
+
+    def __init__(self, path, empty=False, convert=None):
+        self.path = path.split('.')
+        self.empty = empty
+        self.convert = convert
+
+
+class Many:
+    """A list of objects built by serializer ``name`` from x2many ``path``."""
+
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+
+
+class Serializer:
+
+    def __init__(self, fields):
+        self.fields = {
+            key: Field(spec) if isinstance(spec, str) else spec
+            for key, spec in fields.items()
+        }
+        self.tree = {}
+        for spec in self.fields.values():
+            if isinstance(spec, Many):
+                continue
+            node = self.tree
+            for name in spec.path:
+                node = node.setdefault(name, {})
+
+    def subset(self, keys):
+        """Serializer of the ``keys`` of this one only."""
+        return Serializer({key: self.fields[key] for key in keys})
+
+    def serialize(self, records):
+        rows = _read_tree(records, self.tree)
+        return self._build(records, [rows[i] for i in records.ids if i in rows])
+
+    def serialize_lines(self, records, field):
+        """Serialize the lines of ``records`` in x2many ``field`` →
+        ``{record id: [line dict]}``.
+
+        Stored one2many lines are fetched with one ``search_read`` on the
+        line model, without reading the line ids on ``records`` first.
+        """
+        if not records:
+            return {}
+        Lines = records.env[field.comodel_name].with_context(**field.context)
+        if field.type != 'one2many' or not field.store:
+            line_ids = {row['id']: row[field.name] for row in records.read([field.name], load=None)}
+            lines = Lines.browse(list(dict.fromkeys(i for ids in line_ids.values() for i in ids)))
+            serialized = dict(zip(lines.ids, self.serialize(lines)))
+            return {
+                record_id: [serialized[i] for i in ids if i in serialized]
+                for record_id, ids in line_ids.items()
+            }
+
+        fnames = [name for name in self.tree if name != 'id']
+        rows = Lines.search_read(
+            [(field.inverse_name, 'in', records.ids)] + field.get_domain_list(records),
+            list(dict.fromkeys(fnames + [field.inverse_name])),
+            load=None,
+        )
+        parents = [row[field.inverse_name] for row in rows]
+        _read_relations(Lines, rows, self.tree)
+
+        result = defaultdict(list)
+        for parent_id, data in zip(parents, self._build(Lines, rows)):
+            result[parent_id].append(data)
+        return result
+
+    def _build(self, model, rows):
+        # Nested lists: one serialization for the lines of all records
+        records = model.browse([row['id'] for row in rows])
+        nested = {
+            key: _serializers[spec.name].serialize_lines(records, records._fields[spec.path])
+            for key, spec in self.fields.items()
+            if isinstance(spec, Many)
+        }
+
+        result = []
+        for row in rows:
+            data = {}
+            for key, spec in self.fields.items():
+                if isinstance(spec, Many):
+                    data[key] = nested[key].get(row['id'], [])
+                else:
+                    data[key] = _extract(row, spec)
+            result.append(data)
+        return result
+
+
+def _read_tree(records, tree):
+    """Read ``tree`` on ``records`` → ``{id: row}``.
+
+    Relational values with a subtree are replaced by the rows of their
+    targets (``None`` for an empty many2one), read once for all records.
+    """
+    fnames = [name for name in tree if name != 'id']
+    if fnames:
+        rows = records.read(fnames, load=None)
+    else:
+        rows = [{'id': record_id} for record_id in records.ids]
+    _read_relations(records, rows, tree)
+    return {row['id']: row for row in rows}
+
+
+def _read_relations(model, rows, tree):
+    """Replace the relational values of ``rows`` that have a subtree by
+    the rows of their targets, in place."""
+    for name, subtree in tree.items():
+        field = model._fields[name]
+        if not subtree or not field.relational:
+            continue
+        if field.type == 'many2one':
+            ids = {row[name] for row in rows if row[name]}
+        else:
+            ids = {i for row in rows for i in row[name]}
+        targets = _read_tree(model.env[field.comodel_name].browse(ids), subtree)
+        for row in rows:
+            if field.type == 'many2one':
+                row[name] = targets.get(row[name]) if row[name] else None
+            else:
+                row[name] = [targets[i] for i in row[name] if i in targets]
+
+
+def _extract(row, spec):
+    value = row
+    for name in spec.path:
+        if value is None:
+            return spec.empty
+        value = value[name]
+    return spec.convert(value) if spec.convert else value
+
+
+def register_serializer(name, fields):
+    """Register the serializer ``name``, usually the model it applies to."""
+    _serializers[name] = Serializer(fields)
+    return _serializers[name]
+
+
+def serialize(name, records, keys=None):
+    """Serialize ``records`` with serializer ``name`` → list of dicts, in
+    the order of ``records``. ``keys`` restricts the output to these keys
+    (see :func:`parse_fieldset`); fields and lines of other keys are not
+    read at all."""
+    serializer = _serializers[name]
+    if keys is not None:
+        serializer = serializer.subset(keys)
+    return serializer.serialize(records)
+
+
+def parse_fieldset(name, params):
+    """``?fields=`` / ``?include=`` → the keys of serializer ``name`` to
+    return, in serializer order, or ``None`` for all of them.
+
+    ``fields`` lists the keys to return (all by default). ``include`` lists
+    the embedded lists to add; without it they are all sent, unless
+    ``fields`` is given. ``?include=`` alone thus gives the full header
+    without any line. Raises ``ValueError`` on unknown keys.
+    """
+    fields = params.get('fields')
+    include = params.get('include')
+    if fields is None and include is None:
+        return None
+
+    specs = _serializers[name].fields
+    embedded = [key for key, spec in specs.items() if isinstance(spec, Many)]
+
+    if fields is None:
+        wanted = {key for key in specs if key not in embedded}
+    else:
+        wanted = {key.strip() for key in fields.split(',') if key.strip()}
+    unknown = wanted - set(specs)
+    if unknown:
+        raise ValueError(f"Unknown fields {', '.join(sorted(unknown))}, expected {', '.join(specs)}")
+
+    if include is None:
+        included = set(embedded) if fields is None else set()
+    else:
+        included = {key.strip() for key in include.split(',') if key.strip()}
+    unknown = included - set(embedded)
+    if unknown:
+        raise ValueError(f"Cannot include {', '.join(sorted(unknown))}, expected {', '.join(embedded)}")
+
+    return tuple(key for key in specs if key in wanted | included)
+
+
+def json_dumps(data):
+    """Encode ``data`` like ``request.make_json_response`` does, with orjson
+    when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=date_utils.json_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, ensure_ascii=False, default=date_utils.json_default).encode()
+
+
+def _compress(body):
+    """``body`` → ``(body, content encoding)``, compressed with the best
+    encoding the client accepts (brotli, then gzip) when it is worth it."""
+    if len(body) < COMPRESS_MIN_SIZE:
+        return body, None
+    encodings = ['br', 'gzip'] if brotli is not None else ['gzip']
+    encoding = request.httprequest.accept_encodings.best_match(encodings)
+    if encoding == 'br':
+        return brotli.compress(body, quality=4), encoding
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6), encoding
+    return body, None
+
+
+def json_response(data, status=200, headers=None):
+    """Drop-in for ``request.make_json_response`` using :func:`json_dumps`,
+    compressed according to ``Accept-Encoding`` above ``COMPRESS_MIN_SIZE``."""
+    body, encoding = _compress(json_dumps(data))
+    headers = Headers(headers)
+    headers['Content-Length'] = len(body)
+    if 'Content-Type' not in headers:
+        headers['Content-Type'] = 'application/json; charset=utf-8'
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    headers.add('Vary', 'Accept-Encoding')
+    return request.make_response(body, headers.to_wsgi_list(), status=status)
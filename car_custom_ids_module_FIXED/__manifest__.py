@@ -1,7 +1,7 @@
 {
     "name": "Car Custom IDs Workflow",
     "version": "18.0.1.0.0",
-    "depends": ["stock", "purchase", "sale", "mail"],
+    "depends": ["stock", "purchase", "sale", "mail", "api_v2_common"],
     "data": [
         "security/ir.model.access.csv",
         "data/sequence.xml",
@@ -5,85 +5,163 @@ import logging
 from odoo import http
 from odoo.http import request
 
+from odoo.addons.api_v2_common.tools import (
+    Field, Many, count_collection, get_validators, instrument, json_response,
+    not_modified_response, parse_fieldset, parse_filters, prepare_line_commands,
+    rate_limit, register_serializer, resolve_record, search_collection,
+    serialize, set_validators,
+)
+from odoo.addons.api_v2_common.tools.lines import _is_id
+
 _logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('stock.picking', {
+    'id': 'id',
+    'name': 'name',
+    'partner': Field('partner_id.name', empty=None),
+    'state': 'state',
+    'picking_type': 'picking_type_id.name',
+    'scheduled_date': 'scheduled_date',
+})
+
+register_serializer('stock.picking.detail', {
+    'id': 'id',
+    'name': 'name',
+    'state': 'state',
+    'partner': Field('partner_id.name', empty=None),
+    'picking_type': 'picking_type_id.name',
+    'source_location': 'location_id.complete_name',
+    'destination_location': 'location_dest_id.complete_name',
+    'moves': Many('move_ids_without_package', 'stock.move'),
+})
+
+register_serializer('stock.move', {
+    'move_id': 'id',
+    'product_id': 'product_id.id',
+    'product': 'product_id.name',
+    'quantity': 'product_uom_qty',
+    'done_qty': 'quantity',
+})
+
+# ---------------------------------------------------
+# Filters (query parameter → (field, operator))
+# ---------------------------------------------------
+PICKING_FILTERS = {
+    'state': ('state', 'in'),
+    'partner_id': ('partner_id', 'in'),
+    'date_from': ('scheduled_date', '>='),
+    'date_to': ('scheduled_date', '<='),
+}
+
+PICKING_ORDER_FIELDS = ('id', 'name', 'scheduled_date', 'state')
+
 
 class InventoryRestAPI(http.Controller):
 
     # ---------------------------------------------------
-    # Helper → Get Picking by ID or NAME
+    # Helper → Get Picking by ID or NAME (id:/name: prefixes)
     # ---------------------------------------------------
     def _get_picking(self, identifier):
-        Picking = request.env['stock.picking'].sudo()
-
-        if str(identifier).isdigit():
-            picking = Picking.browse(int(identifier))
-            if picking.exists():
-                return picking
-
-        return Picking.search([('name', '=', identifier)], limit=1)
+        return resolve_record(request.env['stock.picking'].sudo(), identifier)
 
     # ===================================================
     # GET → All Pickings
     # ===================================================
     @http.route('/api/v2/inventory', type='http', auth='user',
                 methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
     def get_pickings(self, **kwargs):
-        pickings = request.env['stock.picking'].sudo().search([])
+        try:
+            Picking = request.env['stock.picking'].sudo()
+            domain, order = parse_filters(Picking, kwargs, PICKING_FILTERS, PICKING_ORDER_FIELDS)
+            pickings, sync = search_collection(Picking, domain, kwargs, order=order)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
 
-        data = [{
-            'id': p.id,
-            'name': p.name,
-            'partner': p.partner_id.name if p.partner_id else None,
-            'state': p.state,
-            'picking_type': p.picking_type_id.name,
-            'scheduled_date': p.scheduled_date,
-        } for p in pickings]
+        data = serialize('stock.picking', pickings)
 
-        return request.make_json_response({
+        return json_response({
             'status': 'success',
             'count': len(data),
-            'data': data
+            'data': data,
+            **sync
         })
 
+    # ===================================================
+    # GET → Count Pickings (same filters, no data)
+    # ===================================================
+    @http.route('/api/v2/inventory/count', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    def count_pickings(self, **kwargs):
+        try:
+            Picking = request.env['stock.picking'].sudo()
+            domain, _order = parse_filters(Picking, kwargs, PICKING_FILTERS, PICKING_ORDER_FIELDS)
+            count = count_collection(Picking, domain, kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        return request.make_json_response({'status': 'success', 'count': count})
+
     # ===================================================
     # GET → Single Picking
     # ===================================================
     @http.route('/api/v2/inventory/<string:identifier>', type='http',
-                auth='user', methods=['GET'], csrf=False)
+                auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def get_picking(self, identifier, **kwargs):
         picking = self._get_picking(identifier)
 
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if picking else 404)
+
         if not picking:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Picking not found'},
                 status=404
             )
 
-        data = {
-            'id': picking.id,
-            'name': picking.name,
-            'state': picking.state,
-            'partner': picking.partner_id.name if picking.partner_id else None,
-            'picking_type': picking.picking_type_id.name,
-            'source_location': picking.location_id.complete_name,
-            'destination_location': picking.location_dest_id.complete_name,
-            'moves': [{
-                'move_id': m.id,
-                'product_id': m.product_id.id,
-                'product': m.product_id.name,
-                'quantity': m.product_uom_qty,
-                'done_qty': m.quantity_done,
-            } for m in picking.move_ids_without_package]
-        }
+        try:
+            keys = parse_fieldset('stock.picking.detail', kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        # The moves are only read (and part of the ETag) when they are sent
+        lines_field = 'move_ids' if keys is None or 'moves' in keys else None
+
+        # Unchanged since the client's copy → 304 without serializing
+        etag, last_modified = get_validators(picking, lines_field, keys)
+        not_modified = not_modified_response(etag, last_modified)
+        if not_modified:
+            return not_modified
 
-        return request.make_json_response({'status': 'success', 'data': data})
+        data = serialize('stock.picking.detail', picking, keys)[0]
+
+        return set_validators(
+            json_response({'status': 'success', 'data': data}),
+            etag, last_modified
+        )
 
     # ===================================================
     # POST → Create Picking
     # ===================================================
     @http.route('/api/v2/inventory', type='http', auth='user',
                 methods=['POST'], csrf=False)
+    @instrument
     def create_picking(self, **kwargs):
         try:
             payload = json.loads(request.httprequest.data or '{}')
@@ -140,11 +218,139 @@ class InventoryRestAPI(http.Controller):
                 status=500
             )
 
+    # ===================================================
+    # POST → Batch Create Pickings
+    # ===================================================
+    @http.route('/api/v2/inventory/batch', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def batch_pickings(self, **kwargs):
+        try:
+            payload = json.loads(request.httprequest.data or '[]')
+        except ValueError:
+            payload = None
+
+        pickings = payload.get('pickings') if isinstance(payload, dict) else payload
+        if not isinstance(pickings, list) or not pickings:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'A non-empty list of pickings is required'},
+                status=400
+            )
+
+        env = request.env
+
+        # All products of the batch in one query; browse().exists() keeps
+        # archived products valid (type(...) is int leaves out booleans)
+        product_ids = {
+            move.get('product_id')
+            for p in pickings if isinstance(p, dict)
+            for move in p.get('moves') or []
+            if isinstance(move, dict) and type(move.get('product_id')) is int
+        }
+        products = {p.id: p for p in env['product.product'].sudo().browse(product_ids).exists()}
+
+        required_fields = ['picking_type_id', 'location_id', 'location_dest_id', 'moves']
+        results = [None] * len(pickings)
+        to_create = []   # (index, vals)
+
+        for index, picking in enumerate(pickings):
+            if not isinstance(picking, dict):
+                results[index] = {'index': index, 'status': 'error', 'message': 'Picking must be an object'}
+                continue
+
+            missing = [field for field in required_fields if not picking.get(field)]
+            if missing:
+                results[index] = {'index': index, 'status': 'error', 'message': f'{missing[0]} is required'}
+                continue
+
+            moves = []
+            for move in picking['moves']:
+                product_id = move.get('product_id') if isinstance(move, dict) else None
+                product = products.get(product_id) if type(product_id) is int else None
+                if not product:
+                    results[index] = {'index': index, 'status': 'error',
+                                      'message': f"Invalid product_id {product_id}"}
+                    break
+
+                moves.append((0, 0, {
+                    'name': product.name,
+                    'product_id': product.id,
+                    'product_uom_qty': move.get('quantity', 1),
+                    'product_uom': product.uom_id.id,
+                    'location_id': picking['location_id'],
+                    'location_dest_id': picking['location_dest_id'],
+                }))
+
+            if results[index]:
+                continue
+
+            to_create.append((index, {
+                'partner_id': picking.get('partner_id'),
+                'picking_type_id': picking['picking_type_id'],
+                'location_id': picking['location_id'],
+                'location_dest_id': picking['location_dest_id'],
+                'move_ids_without_package': moves,
+            }))
+
+        # Pickings and their moves in one create, per-record savepoints on failure
+        Picking = env['stock.picking'].sudo()
+        if to_create:
+            try:
+                with env.cr.savepoint():
+                    created = Picking.create([vals for _index, vals in to_create])
+                for (index, _vals), picking in zip(to_create, created):
+                    results[index] = {'index': index, 'status': 'created', 'id': picking.id, 'name': picking.name}
+            except Exception:
+                for index, vals in to_create:
+                    try:
+                        with env.cr.savepoint():
+                            picking = Picking.create(vals)
+                        results[index] = {'index': index, 'status': 'created', 'id': picking.id, 'name': picking.name}
+                    except Exception as e:
+                        results[index] = {'index': index, 'status': 'error', 'message': str(e)}
+
+        return request.make_json_response({
+            'status': 'success',
+            'created': sum(1 for r in results if r['status'] == 'created'),
+            'failed': sum(1 for r in results if r['status'] == 'error'),
+            'results': results,
+        })
+
+    # ===================================================
+    # PATCH → Validate Many Pickings
+    # ===================================================
+    @http.route('/api/v2/inventory/validate', type='http', auth='user',
+                methods=['PATCH'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def batch_validate_pickings(self, **kwargs):
+        payload = json.loads(request.httprequest.data or '{}')
+        ids = payload.get('ids')
+
+        if not isinstance(ids, list) or not all(_is_id(i) for i in ids):
+            return request.make_json_response(
+                {'status': 'error', 'message': 'ids must be a list of integers'},
+                status=400
+            )
+
+        pickings = request.env['stock.picking'].sudo().browse(ids).exists()
+        found = set(pickings.ids)
+        errors = {i: 'Picking not found' for i in ids if i not in found}
+        errors.update(pickings._api_validate_batch())
+
+        return request.make_json_response({
+            'status': 'success',
+            'validated': [p.id for p in pickings if p.id not in errors],
+            'errors': [{'id': i, 'message': message} for i, message in errors.items()],
+        })
+
     # ===================================================
     # PUT → Update Moves (Draft Only)
     # ===================================================
     @http.route('/api/v2/inventory/<string:identifier>', type='http',
                 auth='user', methods=['PUT'], csrf=False)
+    @instrument
     def update_picking(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         picking = self._get_picking(identifier)
@@ -161,26 +367,27 @@ class InventoryRestAPI(http.Controller):
                 status=400
             )
 
-        commands = []
-
-        for line in payload.get('update_moves', []):
-            commands.append((1, line['move_id'], {
-                'product_uom_qty': line.get('quantity'),
-            }))
-
-        for line in payload.get('new_moves', []):
-            product = request.env['product.product'].sudo().browse(line['product_id'])
-            commands.append((0, 0, {
+        commands, error = prepare_line_commands(
+            picking, 'move_ids_without_package', payload,
+            update_vals=lambda move: {
+                'product_uom_qty': move.get('quantity'),
+            },
+            create_vals=lambda move, product: {
                 'name': product.name,
                 'product_id': product.id,
-                'product_uom_qty': line.get('quantity', 1),
+                'product_uom_qty': move.get('quantity', 1),
                 'product_uom': product.uom_id.id,
                 'location_id': picking.location_id.id,
                 'location_dest_id': picking.location_dest_id.id,
-            }))
-
-        for move_id in payload.get('delete_moves', []):
-            commands.append((2, move_id, 0))
+            },
+            keys=('update_moves', 'new_moves', 'delete_moves'),
+            id_key='move_id',
+        )
+        if error:
+            return request.make_json_response(
+                {'status': 'error', 'message': error},
+                status=400
+            )
 
         if commands:
             picking.write({'move_ids_without_package': commands})
@@ -194,6 +401,7 @@ class InventoryRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/inventory/<string:identifier>/validate',
                 type='http', auth='user', methods=['PATCH'], csrf=False)
+    @instrument
     def validate_picking(self, identifier, **kwargs):
         picking = self._get_picking(identifier)
 
@@ -203,13 +411,7 @@ class InventoryRestAPI(http.Controller):
                 status=404
             )
 
-        picking.action_confirm()
-        picking.action_assign()
-
-        for move in picking.move_ids_without_package:
-            move.quantity_done = move.product_uom_qty
-
-        picking.button_validate()
+        picking._api_validate()
 
         return request.make_json_response(
             {'status': 'success', 'message': 'Picking validated'}
@@ -220,6 +422,7 @@ class InventoryRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/inventory/<string:identifier>', type='http',
                 auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_picking(self, identifier, **kwargs):
         picking = self._get_picking(identifier)
 
@@ -246,12 +449,21 @@ class InventoryRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/inventory', type='http',
                 auth='user', methods=['OPTIONS'], csrf=False)
+    @instrument
     def options_inventory(self, **kwargs):
         info = {
             'collection': {
                 'endpoint': '/api/v2/inventory',
                 'methods': ['GET', 'POST', 'OPTIONS'],
             },
+            'batch': {
+                'endpoint': '/api/v2/inventory/batch',
+                'methods': ['POST'],
+            },
+            'batch_validate': {
+                'endpoint': '/api/v2/inventory/validate',
+                'methods': ['PATCH'],
+            },
             'single_resource': {
                 'endpoint': '/api/v2/inventory/<id_or_name>',
                 'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
@@ -5,88 +5,163 @@ import logging
 from odoo import http
 from odoo.http import request
 
+from odoo.addons.api_v2_common.tools import (
+    Field, Many, count_collection, get_validators, instrument, json_response,
+    not_modified_response, parse_fieldset, parse_filters, prepare_line_commands,
+    rate_limit, register_serializer, resolve_record, search_collection,
+    serialize, set_validators,
+)
+
 _logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('purchase.order', {
+    'id': 'id',
+    'name': 'name',
+    'vendor': Field('partner_id.name', empty=None),
+    'state': 'state',
+    'date_order': 'date_order',
+    'amount_total': 'amount_total',
+    'currency': Field('currency_id.name', empty=None),
+})
+
+register_serializer('purchase.order.detail', {
+    'id': 'id',
+    'name': 'name',
+    'vendor': Field('partner_id.name', empty=None),
+    'state': 'state',
+    'date_order': 'date_order',
+    'amount_total': 'amount_total',
+    'lines': Many('order_line', 'purchase.order.line'),
+})
+
+register_serializer('purchase.order.line', {
+    'line_id': 'id',
+    'product_id': 'product_id.id',
+    'product': 'product_id.name',
+    'quantity': 'product_qty',
+    'price_unit': 'price_unit',
+    'subtotal': 'price_subtotal',
+})
+
+# ---------------------------------------------------
+# Filters (query parameter → (field, operator))
+# ---------------------------------------------------
+PURCHASE_FILTERS = {
+    'state': ('state', 'in'),
+    'partner_id': ('partner_id', 'in'),
+    'date_from': ('date_order', '>='),
+    'date_to': ('date_order', '<='),
+}
+
+PURCHASE_ORDER_FIELDS = ('id', 'name', 'date_order', 'amount_total', 'state')
+
 
 class PurchaseOrderRestAPI(http.Controller):
 
     # ---------------------------------------------------
-    # Helper → Get Purchase Order by ID or NAME
+    # Helper → Get Purchase Order by ID or NAME (id:/name: prefixes)
     # ---------------------------------------------------
     def _get_po(self, identifier):
-        PurchaseOrder = request.env['purchase.order'].sudo()
-
-        # Try numeric ID
-        if str(identifier).isdigit():
-            po = PurchaseOrder.browse(int(identifier))
-            if po.exists():
-                return po
-
-        # Fallback to PO number (name)
-        return PurchaseOrder.search([('name', '=', identifier)], limit=1)
+        return resolve_record(request.env['purchase.order'].sudo(), identifier)
 
     # ===================================================
     # GET → All Purchase Orders (LIKE EMPLOYEES)
     # ===================================================
     @http.route('/api/v2/purchases', type='http', auth='user',
                 methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
     def get_purchases(self, **kwargs):
-        purchases = request.env['purchase.order'].sudo().search([])
-
-        data = [{
-            'id': po.id,
-            'name': po.name,
-            'vendor': po.partner_id.name if po.partner_id else None,
-            'state': po.state,
-            'date_order': po.date_order,
-            'amount_total': po.amount_total,
-            'currency': po.currency_id.name if po.currency_id else None,
-        } for po in purchases]
+        try:
+            PurchaseOrder = request.env['purchase.order'].sudo()
+            domain, order = parse_filters(PurchaseOrder, kwargs, PURCHASE_FILTERS, PURCHASE_ORDER_FIELDS)
+            purchases, sync = search_collection(PurchaseOrder, domain, kwargs, order=order)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
 
-        return request.make_json_response({
+        data = serialize('purchase.order', purchases)
+
+        return json_response({
             'status': 'success',
             'count': len(data),
-            'data': data
+            'data': data,
+            **sync
         })
 
+    # ===================================================
+    # GET → Count Purchase Orders (same filters, no data)
+    # ===================================================
+    @http.route('/api/v2/purchases/count', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    def count_purchases(self, **kwargs):
+        try:
+            PurchaseOrder = request.env['purchase.order'].sudo()
+            domain, _order = parse_filters(PurchaseOrder, kwargs, PURCHASE_FILTERS, PURCHASE_ORDER_FIELDS)
+            count = count_collection(PurchaseOrder, domain, kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        return request.make_json_response({'status': 'success', 'count': count})
+
     # ===================================================
     # GET → Single Purchase Order (ID or NAME)
     # ===================================================
     @http.route('/api/v2/purchases/<string:identifier>', type='http',
-                auth='user', methods=['GET'], csrf=False)
+                auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def get_purchase(self, identifier, **kwargs):
         po = self._get_po(identifier)
 
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if po else 404)
+
         if not po:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Purchase Order not found'},
                 status=404
             )
 
-        data = {
-            'id': po.id,
-            'name': po.name,
-            'vendor': po.partner_id.name if po.partner_id else None,
-            'state': po.state,
-            'date_order': po.date_order,
-            'amount_total': po.amount_total,
-            'lines': [{
-                'line_id': l.id,
-                'product_id': l.product_id.id,
-                'product': l.product_id.name,
-                'quantity': l.product_qty,
-                'price_unit': l.price_unit,
-                'subtotal': l.price_subtotal,
-            } for l in po.order_line]
-        }
+        try:
+            keys = parse_fieldset('purchase.order.detail', kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        # The lines are only read (and part of the ETag) when they are sent
+        lines_field = 'order_line' if keys is None or 'lines' in keys else None
 
-        return request.make_json_response({'status': 'success', 'data': data})
+        # Unchanged since the client's copy → 304 without serializing
+        etag, last_modified = get_validators(po, lines_field, keys)
+        not_modified = not_modified_response(etag, last_modified)
+        if not_modified:
+            return not_modified
+
+        data = serialize('purchase.order.detail', po, keys)[0]
+
+        return set_validators(
+            json_response({'status': 'success', 'data': data}),
+            etag, last_modified
+        )
 
     # ===================================================
     # POST → Create Purchase Order
     # ===================================================
     @http.route('/api/v2/purchases', type='http', auth='user',
                 methods=['POST'], csrf=False)
+    @instrument
     def create_purchase(self, **kwargs):
         try:
             payload = json.loads(request.httprequest.data or '{}')
@@ -123,11 +198,155 @@ class PurchaseOrderRestAPI(http.Controller):
                 status=500
             )
 
+    # ===================================================
+    # POST → Batch Create / Upsert Purchase Orders
+    # ===================================================
+    @http.route('/api/v2/purchases/batch', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def batch_purchases(self, **kwargs):
+        try:
+            payload = json.loads(request.httprequest.data or '[]')
+        except ValueError:
+            payload = None
+
+        orders = payload.get('orders') if isinstance(payload, dict) else payload
+        if not isinstance(orders, list) or not orders:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'A non-empty list of orders is required'},
+                status=400
+            )
+
+        env = request.env
+        PurchaseOrder = env['purchase.order'].sudo()
+
+        # One query each for partners, products and existing references. Only
+        # well-typed values are collected: the others fail their own order
+        # (type(...) is int also leaves out booleans)
+        dict_orders = [o for o in orders if isinstance(o, dict)]
+        partner_ids = {o.get('partner_id') for o in dict_orders if type(o.get('partner_id')) is int}
+        product_ids = {
+            line.get('product_id')
+            for o in dict_orders if isinstance(o.get('order_lines'), list)
+            for line in o['order_lines']
+            if isinstance(line, dict) and type(line.get('product_id')) is int
+        }
+        refs = {o['external_ref'] for o in dict_orders if isinstance(o.get('external_ref'), str) and o['external_ref']}
+
+        # browse().exists(): archived partners and products stay valid
+        valid_partners = set(env['res.partner'].sudo().browse(partner_ids).exists().ids)
+        valid_products = set(env['product.product'].sudo().browse(product_ids).exists().ids)
+        # External references are unique per company
+        existing = {
+            po.external_ref: po
+            for po in PurchaseOrder.search([
+                ('external_ref', 'in', list(refs)),
+                ('company_id', '=', env.company.id),
+            ])
+        } if refs else {}
+
+        results = [None] * len(orders)
+        to_create = []   # (index, vals)
+        to_update = []   # (index, po, vals)
+
+        for index, order in enumerate(orders):
+            error = self._check_batch_order(order, valid_partners, valid_products)
+            if error:
+                results[index] = {'index': index, 'status': 'error', 'message': error}
+                continue
+
+            lines = []
+            for line in order['order_lines']:
+                vals = {
+                    'product_id': line['product_id'],
+                    'product_qty': line.get('quantity', 1),
+                    'price_unit': line.get('price_unit'),
+                    'date_planned': line.get('date_planned'),
+                }
+                lines.append((0, 0, {k: v for k, v in vals.items() if v is not None}))
+
+            vals = {
+                'partner_id': order['partner_id'],
+                'external_ref': order.get('external_ref') or False,
+                'order_line': lines,
+            }
+            if order.get('date_order'):
+                vals['date_order'] = order['date_order']
+
+            po = existing.get(order.get('external_ref'))
+            if po:
+                to_update.append((index, po, vals))
+            else:
+                to_create.append((index, vals))
+
+        # Upsert: existing draft orders get their header and lines replaced
+        for index, po, vals in to_update:
+            if po.state not in ('draft', 'sent'):
+                results[index] = {
+                    'index': index, 'status': 'error', 'id': po.id, 'name': po.name,
+                    'message': 'Only draft purchase orders can be updated',
+                }
+                continue
+            vals['order_line'] = [(5, 0, 0)] + vals['order_line']
+            try:
+                with env.cr.savepoint():
+                    po.write(vals)
+                results[index] = {'index': index, 'status': 'updated', 'id': po.id, 'name': po.name}
+            except Exception as e:
+                results[index] = {'index': index, 'status': 'error', 'message': str(e)}
+
+        # New orders: one batched create, per-record savepoints only on failure
+        if to_create:
+            try:
+                with env.cr.savepoint():
+                    created = PurchaseOrder.create([vals for _index, vals in to_create])
+                for (index, _vals), po in zip(to_create, created):
+                    results[index] = {'index': index, 'status': 'created', 'id': po.id, 'name': po.name}
+            except Exception:
+                for index, vals in to_create:
+                    try:
+                        with env.cr.savepoint():
+                            po = PurchaseOrder.create(vals)
+                        results[index] = {'index': index, 'status': 'created', 'id': po.id, 'name': po.name}
+                    except Exception as e:
+                        results[index] = {'index': index, 'status': 'error', 'message': str(e)}
+
+        for index, order in enumerate(orders):
+            if isinstance(order, dict) and order.get('external_ref'):
+                results[index]['external_ref'] = order['external_ref']
+
+        return request.make_json_response({
+            'status': 'success',
+            'created': sum(1 for r in results if r['status'] == 'created'),
+            'updated': sum(1 for r in results if r['status'] == 'updated'),
+            'failed': sum(1 for r in results if r['status'] == 'error'),
+            'results': results,
+        })
+
+    def _check_batch_order(self, order, valid_partners, valid_products):
+        if not isinstance(order, dict):
+            return 'Order must be an object'
+        if not order.get('partner_id') or not order.get('order_lines'):
+            return 'partner_id and order_lines required'
+        if not isinstance(order['order_lines'], list):
+            return 'order_lines must be a list'
+        if order.get('external_ref') and not isinstance(order['external_ref'], str):
+            return 'external_ref must be a string'
+        if type(order['partner_id']) is not int or order['partner_id'] not in valid_partners:
+            return f"Invalid partner_id {order['partner_id']}"
+        for line in order['order_lines']:
+            product_id = line.get('product_id') if isinstance(line, dict) else None
+            if type(product_id) is not int or product_id not in valid_products:
+                return f"Invalid product_id {product_id}"
+        return None
+
     # ===================================================
     # PUT → Full Update Purchase Order (LINES)
     # ===================================================
     @http.route('/api/v2/purchases/<string:identifier>', type='http',
                 auth='user', methods=['PUT'], csrf=False)
+    @instrument
     def put_purchase(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         po = self._get_po(identifier)
@@ -138,24 +357,24 @@ class PurchaseOrderRestAPI(http.Controller):
                 status=404
             )
 
-        commands = []
-
-        for line in payload.get('update_lines', []):
-            commands.append((1, line['line_id'], {
+        commands, error = prepare_line_commands(
+            po, 'order_line', payload,
+            update_vals=lambda line: {
                 'product_qty': line.get('quantity'),
                 'price_unit': line.get('price_unit'),
-            }))
-
-        for line in payload.get('new_lines', []):
-            commands.append((0, 0, {
-                'product_id': line['product_id'],
+            },
+            create_vals=lambda line, product: {
+                'product_id': product.id,
                 'product_qty': line.get('quantity', 1),
                 'price_unit': line.get('price_unit', 0),
                 'date_planned': line.get('date_planned'),
-            }))
-
-        for line_id in payload.get('delete_lines', []):
-            commands.append((2, line_id, 0))
+            },
+        )
+        if error:
+            return request.make_json_response(
+                {'status': 'error', 'message': error},
+                status=400
+            )
 
         if commands:
             po.write({'order_line': commands})
@@ -169,6 +388,7 @@ class PurchaseOrderRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/purchases/<string:identifier>', type='http',
                 auth='user', methods=['PATCH'], csrf=False)
+    @instrument
     def patch_purchase(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         po = self._get_po(identifier)
@@ -204,6 +424,7 @@ class PurchaseOrderRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/purchases/<string:identifier>', type='http',
                 auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_purchase(self, identifier, **kwargs):
         po = self._get_po(identifier)
 
@@ -224,12 +445,17 @@ class PurchaseOrderRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/purchases', type='http',
                 auth='user', methods=['OPTIONS'], csrf=False)
+    @instrument
     def options_purchases(self, **kwargs):
         info = {
             'collection': {
                 'endpoint': '/api/v2/purchases',
                 'methods': ['GET', 'POST', 'OPTIONS'],
             },
+            'batch': {
+                'endpoint': '/api/v2/purchases/batch',
+                'methods': ['POST'],
+            },
             'single_resource': {
                 'endpoint': '/api/v2/purchases/<id_or_name>',
                 'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
@@ -5,88 +5,163 @@ import logging
 from odoo import http
 from odoo.http import request
 
+from odoo.addons.api_v2_common.tools import (
+    Field, Many, count_collection, get_validators, instrument, json_response,
+    not_modified_response, parse_fieldset, parse_filters, prepare_line_commands,
+    rate_limit, register_serializer, resolve_record, search_collection,
+    serialize, set_validators,
+)
+
 _logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('sale.order', {
+    'id': 'id',
+    'name': 'name',
+    'customer': Field('partner_id.name', empty=None),
+    'state': 'state',
+    'date_order': 'date_order',
+    'amount_total': 'amount_total',
+    'currency': Field('currency_id.name', empty=None),
+})
+
+register_serializer('sale.order.detail', {
+    'id': 'id',
+    'name': 'name',
+    'customer': Field('partner_id.name', empty=None),
+    'state': 'state',
+    'date_order': 'date_order',
+    'amount_total': 'amount_total',
+    'lines': Many('order_line', 'sale.order.line'),
+})
+
+register_serializer('sale.order.line', {
+    'line_id': 'id',
+    'product_id': 'product_id.id',
+    'product': 'product_id.name',
+    'quantity': 'product_uom_qty',
+    'price_unit': 'price_unit',
+    'subtotal': 'price_subtotal',
+})
+
+# ---------------------------------------------------
+# Filters (query parameter → (field, operator))
+# ---------------------------------------------------
+SALE_FILTERS = {
+    'state': ('state', 'in'),
+    'partner_id': ('partner_id', 'in'),
+    'date_from': ('date_order', '>='),
+    'date_to': ('date_order', '<='),
+}
+
+SALE_ORDER_FIELDS = ('id', 'name', 'date_order', 'amount_total', 'state')
+
 
 class SaleOrderRestAPI(http.Controller):
 
     # ---------------------------------------------------
-    # Helper → Get Sale Order by ID or NAME
+    # Helper → Get Sale Order by ID or NAME (id:/name: prefixes)
     # ---------------------------------------------------
     def _get_so(self, identifier):
-        SaleOrder = request.env['sale.order'].sudo()
-
-        # Try numeric ID
-        if str(identifier).isdigit():
-            so = SaleOrder.browse(int(identifier))
-            if so.exists():
-                return so
-
-        # Fallback to SO number (name)
-        return SaleOrder.search([('name', '=', identifier)], limit=1)
+        return resolve_record(request.env['sale.order'].sudo(), identifier)
 
     # ===================================================
     # GET → All Sale Orders
     # ===================================================
     @http.route('/api/v2/sales', type='http', auth='user',
                 methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
     def get_sales(self, **kwargs):
-        sales = request.env['sale.order'].sudo().search([])
-
-        data = [{
-            'id': so.id,
-            'name': so.name,
-            'customer': so.partner_id.name if so.partner_id else None,
-            'state': so.state,
-            'date_order': so.date_order,
-            'amount_total': so.amount_total,
-            'currency': so.currency_id.name if so.currency_id else None,
-        } for so in sales]
+        try:
+            SaleOrder = request.env['sale.order'].sudo()
+            domain, order = parse_filters(SaleOrder, kwargs, SALE_FILTERS, SALE_ORDER_FIELDS)
+            sales, sync = search_collection(SaleOrder, domain, kwargs, order=order)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
 
-        return request.make_json_response({
+        data = serialize('sale.order', sales)
+
+        return json_response({
             'status': 'success',
             'count': len(data),
-            'data': data
+            'data': data,
+            **sync
         })
 
+    # ===================================================
+    # GET → Count Sale Orders (same filters, no data)
+    # ===================================================
+    @http.route('/api/v2/sales/count', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    def count_sales(self, **kwargs):
+        try:
+            SaleOrder = request.env['sale.order'].sudo()
+            domain, _order = parse_filters(SaleOrder, kwargs, SALE_FILTERS, SALE_ORDER_FIELDS)
+            count = count_collection(SaleOrder, domain, kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        return request.make_json_response({'status': 'success', 'count': count})
+
     # ===================================================
     # GET → Single Sale Order (ID or NAME)
     # ===================================================
     @http.route('/api/v2/sales/<string:identifier>', type='http',
-                auth='user', methods=['GET'], csrf=False)
+                auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def get_sale(self, identifier, **kwargs):
         so = self._get_so(identifier)
 
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if so else 404)
+
         if not so:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Sale Order not found'},
                 status=404
             )
 
-        data = {
-            'id': so.id,
-            'name': so.name,
-            'customer': so.partner_id.name if so.partner_id else None,
-            'state': so.state,
-            'date_order': so.date_order,
-            'amount_total': so.amount_total,
-            'lines': [{
-                'line_id': l.id,
-                'product_id': l.product_id.id,
-                'product': l.product_id.name,
-                'quantity': l.product_uom_qty,
-                'price_unit': l.price_unit,
-                'subtotal': l.price_subtotal,
-            } for l in so.order_line]
-        }
+        try:
+            keys = parse_fieldset('sale.order.detail', kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        # The lines are only read (and part of the ETag) when they are sent
+        lines_field = 'order_line' if keys is None or 'lines' in keys else None
+
+        # Unchanged since the client's copy → 304 without serializing
+        etag, last_modified = get_validators(so, lines_field, keys)
+        not_modified = not_modified_response(etag, last_modified)
+        if not_modified:
+            return not_modified
 
-        return request.make_json_response({'status': 'success', 'data': data})
+        data = serialize('sale.order.detail', so, keys)[0]
+
+        return set_validators(
+            json_response({'status': 'success', 'data': data}),
+            etag, last_modified
+        )
 
     # ===================================================
     # POST → Create Sale Order
     # ===================================================
     @http.route('/api/v2/sales', type='http', auth='user',
                 methods=['POST'], csrf=False)
+    @instrument
     def create_sale(self, **kwargs):
         try:
             payload = json.loads(request.httprequest.data or '{}')
@@ -145,11 +220,131 @@ class SaleOrderRestAPI(http.Controller):
                 status=500
             )
 
+    # ===================================================
+    # POST → Batch Create Sale Orders
+    # ===================================================
+    @http.route('/api/v2/sales/batch', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def batch_sales(self, **kwargs):
+        try:
+            payload = json.loads(request.httprequest.data or '[]')
+        except ValueError:
+            payload = None
+
+        orders = payload.get('orders') if isinstance(payload, dict) else payload
+        if not isinstance(orders, list) or not orders:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'A non-empty list of orders is required'},
+                status=400
+            )
+
+        env = request.env
+        valid = [o for o in orders if isinstance(o, dict)]
+
+        # Ids are looked up with browse().exists(): archived records stay valid
+        # (type(...) is int leaves out booleans and unhashable values)
+
+        # 1️⃣ Partners (their default pricelists are computed for the whole set)
+        partner_ids = {o.get('partner_id') for o in valid if type(o.get('partner_id')) is int}
+        partners = env['res.partner'].sudo().browse(partner_ids).exists()
+        partners_by_id = {p.id: p for p in partners}
+        default_pricelists = {p.id: p.property_product_pricelist for p in partners}
+
+        # 2️⃣ Explicit pricelists
+        pricelist_ids = {o.get('pricelist_id') for o in valid if type(o.get('pricelist_id')) is int}
+        pricelists = {
+            pl.id: pl for pl in env['product.pricelist'].sudo().browse(pricelist_ids).exists()
+        }
+
+        # 3️⃣ Products
+        product_ids = {
+            line.get('product_id')
+            for o in valid for line in o.get('order_lines') or []
+            if isinstance(line, dict) and type(line.get('product_id')) is int
+        }
+        products = {p.id: p for p in env['product.product'].sudo().browse(product_ids).exists()}
+
+        results = [None] * len(orders)
+        to_create = []   # (index, vals)
+
+        for index, order in enumerate(orders):
+            if not isinstance(order, dict) or not order.get('partner_id') or not order.get('order_lines'):
+                results[index] = {'index': index, 'status': 'error',
+                                  'message': 'partner_id and order_lines required'}
+                continue
+
+            partner = partners_by_id.get(order['partner_id']) if type(order['partner_id']) is int else None
+            if not partner:
+                results[index] = {'index': index, 'status': 'error', 'message': 'Invalid partner_id'}
+                continue
+
+            if order.get('pricelist_id'):
+                pricelist = pricelists.get(order['pricelist_id']) if type(order['pricelist_id']) is int else None
+                if not pricelist:
+                    results[index] = {'index': index, 'status': 'error', 'message': 'Invalid pricelist_id'}
+                    continue
+            else:
+                pricelist = default_pricelists.get(partner.id)
+                if not pricelist:
+                    results[index] = {'index': index, 'status': 'error', 'message': 'Customer has no pricelist'}
+                    continue
+
+            lines = []
+            for line in order['order_lines']:
+                product_id = line.get('product_id') if isinstance(line, dict) else None
+                product = products.get(product_id) if type(product_id) is int else None
+                if not product:
+                    results[index] = {'index': index, 'status': 'error',
+                                      'message': f"Invalid product_id {product_id}"}
+                    break
+
+                lines.append((0, 0, {
+                    'product_id': product.id,
+                    'product_uom_qty': line.get('quantity', 1),
+                    'price_unit': line.get('price_unit', product.lst_price),
+                }))
+
+            if results[index]:
+                continue
+
+            to_create.append((index, {
+                'partner_id': partner.id,
+                'pricelist_id': pricelist.id,
+                'order_line': lines,
+            }))
+
+        # One create for the whole batch, per-record savepoints only on failure
+        SaleOrder = env['sale.order'].sudo()
+        if to_create:
+            try:
+                with env.cr.savepoint():
+                    created = SaleOrder.create([vals for _index, vals in to_create])
+                for (index, _vals), so in zip(to_create, created):
+                    results[index] = {'index': index, 'status': 'created', 'id': so.id, 'name': so.name}
+            except Exception:
+                for index, vals in to_create:
+                    try:
+                        with env.cr.savepoint():
+                            so = SaleOrder.create(vals)
+                        results[index] = {'index': index, 'status': 'created', 'id': so.id, 'name': so.name}
+                    except Exception as e:
+                        results[index] = {'index': index, 'status': 'error', 'message': str(e)}
+
+        return request.make_json_response({
+            'status': 'success',
+            'created': sum(1 for r in results if r['status'] == 'created'),
+            'failed': sum(1 for r in results if r['status'] == 'error'),
+            'results': results,
+        })
+
     # ===================================================
     # PUT → Full Update Sale Order (LINES)
     # ===================================================
     @http.route('/api/v2/sales/<string:identifier>', type='http',
                 auth='user', methods=['PUT'], csrf=False)
+    @instrument
     def put_sale(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         so = self._get_so(identifier)
@@ -160,26 +355,24 @@ class SaleOrderRestAPI(http.Controller):
                 status=404
             )
 
-        commands = []
-
-        # Update existing lines
-        for line in payload.get('update_lines', []):
-            commands.append((1, line['line_id'], {
+        # Update / add / delete lines, checked against the order's own lines
+        commands, error = prepare_line_commands(
+            so, 'order_line', payload,
+            update_vals=lambda line: {
                 'product_uom_qty': line.get('quantity'),
                 'price_unit': line.get('price_unit'),
-            }))
-
-        # Add new lines
-        for line in payload.get('new_lines', []):
-            commands.append((0, 0, {
-                'product_id': line['product_id'],
+            },
+            create_vals=lambda line, product: {
+                'product_id': product.id,
                 'product_uom_qty': line.get('quantity', 1),
                 'price_unit': line.get('price_unit', 0),
-            }))
-
-        # Delete lines
-        for line_id in payload.get('delete_lines', []):
-            commands.append((2, line_id, 0))
+            },
+        )
+        if error:
+            return request.make_json_response(
+                {'status': 'error', 'message': error},
+                status=400
+            )
 
         if commands:
             so.write({'order_line': commands})
@@ -193,6 +386,7 @@ class SaleOrderRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/sales/<string:identifier>', type='http',
                 auth='user', methods=['PATCH'], csrf=False)
+    @instrument
     def patch_sale(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         so = self._get_so(identifier)
@@ -228,6 +422,7 @@ class SaleOrderRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/sales/<string:identifier>', type='http',
                 auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_sale(self, identifier, **kwargs):
         so = self._get_so(identifier)
 
@@ -248,12 +443,17 @@ class SaleOrderRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/sales', type='http',
                 auth='user', methods=['OPTIONS'], csrf=False)
+    @instrument
     def options_sales(self, **kwargs):
         info = {
             'collection': {
                 'endpoint': '/api/v2/sales',
                 'methods': ['GET', 'POST', 'OPTIONS'],
             },
+            'batch': {
+                'endpoint': '/api/v2/sales/batch',
+                'methods': ['POST'],
+            },
             'single_resource': {
                 'endpoint': '/api/v2/sales/<id_or_name>',
                 'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
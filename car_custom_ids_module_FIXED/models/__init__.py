@@ -8,3 +8,4 @@ from . import inherit_stock_lot
 from . import inherit_stock_custom
 from . import inherit_stock_picking
 
+from . import inherit_api_job
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields
+
+
+class ApiJob(models.Model):
+    _inherit = "api.job"
+
+    operation = fields.Selection(selection_add=[
+        ('stock_picking_validate', 'Validate Pickings'),
+        ('customs_confirm', 'Confirm Customs Operations'),
+    ], ondelete={
+        'stock_picking_validate': 'cascade',
+        'customs_confirm': 'cascade',
+    })
+
+    def _run_stock_picking_validate(self, ids):
+        pickings, errors = self._browse_payload_ids("stock.picking", ids)
+        errors.update(pickings._api_validate_batch())
+        return errors
+
+    def _run_customs_confirm(self, ids):
+        operations, errors = self._browse_payload_ids("stock.operation.customids", ids)
+        for operation in operations:
+            if operation.status != 'draft':
+                errors[operation.id] = f"Operation is already {operation.status}"
+                continue
+            try:
+                with self.env.cr.savepoint():
+                    operation.action_confirm_operation()
+            except Exception as e:
+                errors[operation.id] = str(e)
+        return errors
@@ -3,7 +3,10 @@ from odoo.exceptions import ValidationError
 
 
 class PurchaseOrder(models.Model):
-    _inherit = "purchase.order"
+    _inherit = ["purchase.order", "api.sync.mixin"]
+
+    # /api/v2/purchases filters: ?state= and ?partner_id= with a date range
+    _api_filter_indexes = [('state', 'date_order'), ('partner_id', 'date_order')]
 
     show_custom_ids_button = fields.Boolean(
         string="Show Customs Button",
@@ -14,6 +17,14 @@ class PurchaseOrder(models.Model):
         'stock.operation.customids', 'purchase_order_id', string='Customs IDs'
     )
 
+    # Reference of the order in the pushing system, used by the batch API upsert
+    external_ref = fields.Char(string="External Reference", copy=False, index=True)
+
+    _sql_constraints = [
+        ('external_ref_company_uniq', 'unique(external_ref, company_id)',
+         'The external reference must be unique per company.'),
+    ]
+
     customids_status = fields.Selection([
         ('none', 'No Operation'),
         ('draft', 'Draft'),
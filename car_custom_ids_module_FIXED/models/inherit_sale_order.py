@@ -8,7 +8,10 @@ from odoo.exceptions import ValidationError
 # =====================================================
 
 class SaleOrder(models.Model):
-    _inherit = "sale.order"
+    _inherit = ["sale.order", "api.sync.mixin"]
+
+    # /api/v2/sales filters: ?state= and ?partner_id= with a date range
+    _api_filter_indexes = [('state', 'date_order'), ('partner_id', 'date_order')]
 
     customids_ids = fields.One2many(
         "stock.operation.customids",
@@ -6,7 +6,10 @@ from odoo.exceptions import ValidationError
 
 
 class StockPicking(models.Model):
-    _inherit = "stock.picking"
+    _inherit = ["stock.picking", "api.sync.mixin"]
+
+    # /api/v2/inventory filters: ?state= and ?partner_id= with a date range
+    _api_filter_indexes = [('state', 'scheduled_date'), ('partner_id', 'scheduled_date')]
 
     def button_validate(self):
         self._check_sale_order_lots_match()
@@ -56,3 +59,47 @@ class StockPicking(models.Model):
                         )
                         msg += "\nExtra: %s" % extra_names
                     raise ValidationError(msg)
+
+    # -------------------------------------------------
+    # API VALIDATION (batch endpoint and background jobs)
+    # -------------------------------------------------
+    def _api_validate(self):
+        """Confirm, reserve, set done quantities and validate the pickings.
+
+        Every step runs once on the combined recordset; done quantities are
+        written once per distinct demand instead of once per move.
+        """
+        self.action_confirm()
+        self.action_assign()
+
+        moves = self.move_ids_without_package
+        for quantity, same_qty_moves in moves.grouped('product_uom_qty').items():
+            same_qty_moves.write({'quantity': quantity, 'picked': True})
+
+        self.button_validate()
+
+    def _api_validate_batch(self):
+        """Validate the pickings in one batch, isolating the failing ones.
+
+        Returns ``{picking_id: error message}`` for the pickings left
+        unvalidated.
+        """
+        errors = {p.id: f"Picking is already {p.state}" for p in self if p.state in ('done', 'cancel')}
+        todo = self.filtered(lambda p: p.id not in errors)
+
+        if todo:
+            try:
+                with self.env.cr.savepoint():
+                    todo._api_validate()
+            except Exception:
+                # Find the pickings that block the batch
+                for picking in todo:
+                    try:
+                        with self.env.cr.savepoint():
+                            picking._api_validate()
+                    except Exception as e:
+                        errors[picking.id] = str(e)
+
+        for picking in todo.filtered(lambda p: p.id not in errors and p.state != 'done'):
+            errors[picking.id] = f"Picking not validated (state: {picking.state})"
+        return errors
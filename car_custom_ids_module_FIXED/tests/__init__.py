@@ -0,0 +1,3 @@
+from . import test_api
+from . import test_line_commands
+from . import test_picking_validate
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import tagged
+
+from odoo.addons.api_v2_common.tests.common import ApiHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestPurchaseRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'API Vendor'})
+        cls.product = cls.env['product.product'].create({'name': 'API Purchase Product'})
+        cls.order = cls._create_order()
+
+    @classmethod
+    def _create_order(cls):
+        return cls.env['purchase.order'].create({
+            'partner_id': cls.vendor.id,
+            'order_line': [(0, 0, {'product_id': cls.product.id, 'product_qty': 2})],
+        })
+
+    def test_count(self):
+        response = self.api('GET', '/api/v2/purchases/count', params={'partner_id': self.vendor.id})
+        self.assertEqual(response.json(), {'status': 'success', 'count': 1})
+
+        response = self.api('GET', '/api/v2/purchases/count', params={'state': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_head(self):
+        response = self.api('HEAD', f'/api/v2/purchases/{self.order.id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.content)
+
+        self.assertEqual(self.api('HEAD', '/api/v2/purchases/name:NO-SUCH-PO').status_code, 404)
+
+    def test_name_lookup_after_rename(self):
+        old_name = self.order.name
+        self.assertEqual(self.api('GET', f'/api/v2/purchases/name:{old_name}').status_code, 200)
+
+        self.order.name = 'API-RENAMED-PO'
+
+        response = self.api('GET', '/api/v2/purchases/name:API-RENAMED-PO')
+        self.assertEqual(response.json()['data']['id'], self.order.id)
+        self.assertEqual(self.api('GET', f'/api/v2/purchases/name:{old_name}').status_code, 404)
+
+    def test_fieldset(self):
+        response = self.api('GET', f'/api/v2/purchases/{self.order.id}', params={'fields': 'id,name'})
+        self.assertEqual(response.json()['data'], {'id': self.order.id, 'name': self.order.name})
+
+        response = self.api('GET', f'/api/v2/purchases/{self.order.id}', params={'fields': 'id,secret'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_conditional_get(self):
+        path = f'/api/v2/purchases/{self.order.id}'
+        response = self.api('GET', path)
+        etag = response.headers['ETag']
+        self.assertTrue(response.headers['Last-Modified'])
+
+        response = self.api('GET', path, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        # A new line changes the representation
+        self.order.order_line = [(0, 0, {'product_id': self.product.id, 'product_qty': 1})]
+        response = self.api('GET', path, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_sync(self):
+        deleted = self._create_order()
+        deleted_id = deleted.id
+        deleted.unlink()
+
+        params = {'updated_since': '2000-01-01T00:00:00', 'partner_id': self.vendor.id}
+        response = self.api('GET', '/api/v2/purchases', params=params).json()
+        self.assertEqual([po['id'] for po in response['data']], [self.order.id])
+        self.assertIn(deleted_id, [t['id'] for t in response['deleted']])
+        self.assertIsNone(response['next_cursor'])
+        self.assertTrue(response['sync_time'])
+
+        # Paging: one record per page, the deletions come with the first one
+        other = self._create_order()
+        first = self.api('GET', '/api/v2/purchases', params={**params, 'limit': 1}).json()
+        self.assertEqual([po['id'] for po in first['data']], [self.order.id])
+        self.assertTrue(first['next_cursor'])
+
+        second = self.api('GET', '/api/v2/purchases', params={
+            'cursor': first['next_cursor'], 'partner_id': self.vendor.id, 'limit': 1,
+        }).json()
+        self.assertEqual([po['id'] for po in second['data']], [other.id])
+        self.assertNotIn('deleted', second)
+
+        response = self.api('GET', '/api/v2/purchases/count', params={
+            'cursor': first['next_cursor'], 'partner_id': self.vendor.id,
+        })
+        self.assertEqual(response.json()['count'], 1)
+
+        response = self.api('GET', '/api/v2/purchases', params={'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch(self):
+        orders = [
+            {'partner_id': self.vendor.id, 'external_ref': 'API-EXT-1',
+             'order_lines': [{'product_id': self.product.id, 'quantity': 3}]},
+            {'partner_id': [self.vendor.id], 'order_lines': [{'product_id': self.product.id}]},
+            {'partner_id': True, 'order_lines': [{'product_id': self.product.id}]},
+            {'partner_id': self.vendor.id, 'order_lines': [{'product_id': {'id': self.product.id}}]},
+            {'partner_id': self.vendor.id, 'external_ref': ['API-EXT-2'],
+             'order_lines': [{'product_id': self.product.id}]},
+        ]
+        response = self.api('POST', '/api/v2/purchases/batch', orders)
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual((result['created'], result['failed']), (1, 4))
+        self.assertEqual([r['status'] for r in result['results']], ['created'] + ['error'] * 4)
+
+        # Same reference → the draft order is updated in place
+        po = self.env['purchase.order'].browse(result['results'][0]['id'])
+        orders = [{'partner_id': self.vendor.id, 'external_ref': 'API-EXT-1',
+                   'order_lines': [{'product_id': self.product.id, 'quantity': 5}]}]
+        result = self.api('POST', '/api/v2/purchases/batch', {'orders': orders}).json()
+        self.assertEqual(result['results'][0], {
+            'index': 0, 'status': 'updated', 'id': po.id, 'name': po.name, 'external_ref': 'API-EXT-1',
+        })
+        self.assertEqual(po.order_line.product_qty, 5)
+
+    def test_batch_archived_product(self):
+        self.product.action_archive()
+        orders = [{'partner_id': self.vendor.id, 'order_lines': [{'product_id': self.product.id}]}]
+
+        result = self.api('POST', '/api/v2/purchases/batch', orders).json()
+
+        self.assertEqual(result['created'], 1)
+
+
+@tagged('post_install', '-at_install')
+class TestSaleRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.customer = cls.env['res.partner'].create({'name': 'API Customer'})
+        cls.product = cls.env['product.product'].create({'name': 'API Sale Product', 'list_price': 10})
+        cls.pricelist = cls.env['product.pricelist'].create({'name': 'API Pricelist'})
+        cls.order = cls.env['sale.order'].create({
+            'partner_id': cls.customer.id,
+            'pricelist_id': cls.pricelist.id,
+            'order_line': [(0, 0, {'product_id': cls.product.id})],
+        })
+
+    def test_count(self):
+        response = self.api('GET', '/api/v2/sales/count', params={'partner_id': self.customer.id})
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_head(self):
+        self.assertEqual(self.api('HEAD', f'/api/v2/sales/{self.order.id}').status_code, 200)
+        self.assertEqual(self.api('HEAD', '/api/v2/sales/name:NO-SUCH-SO').status_code, 404)
+
+    def test_batch(self):
+        self.product.action_archive()
+        orders = [
+            {'partner_id': self.customer.id, 'pricelist_id': self.pricelist.id,
+             'order_lines': [{'product_id': self.product.id, 'quantity': 2}]},
+            {'partner_id': [self.customer.id], 'order_lines': [{'product_id': self.product.id}]},
+            {'partner_id': self.customer.id, 'pricelist_id': True,
+             'order_lines': [{'product_id': self.product.id}]},
+            {'partner_id': self.customer.id, 'pricelist_id': self.pricelist.id,
+             'order_lines': [{'product_id': [self.product.id]}]},
+        ]
+
+        result = self.api('POST', '/api/v2/sales/batch', orders).json()
+
+        self.assertEqual((result['created'], result['failed']), (1, 3))
+        so = self.env['sale.order'].browse(result['results'][0]['id'])
+        self.assertEqual(so.order_line.product_id, self.product)
+        self.assertEqual(so.order_line.product_uom_qty, 2)
+
+
+@tagged('post_install', '-at_install')
+class TestInventoryRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product = cls.env['product.product'].create({'name': 'API Stock Product', 'is_storable': True})
+        cls.picking_type = cls.env.ref('stock.picking_type_in')
+        cls.location = cls.picking_type.default_location_src_id
+        cls.location_dest = cls.picking_type.default_location_dest_id
+
+    def _picking_vals(self, quantity=1):
+        return {
+            'picking_type_id': self.picking_type.id,
+            'location_id': self.location.id,
+            'location_dest_id': self.location_dest.id,
+            'moves': [{'product_id': self.product.id, 'quantity': quantity}],
+        }
+
+    def test_count_and_head(self):
+        result = self.api('POST', '/api/v2/inventory/batch', [self._picking_vals()]).json()
+        picking_id = result['results'][0]['id']
+
+        response = self.api('GET', '/api/v2/inventory/count', params={'state': 'draft,assigned'})
+        self.assertEqual(response.json()['count'], self.env['stock.picking'].search_count(
+            [('state', 'in', ('draft', 'assigned'))]))
+
+        self.assertEqual(self.api('HEAD', f'/api/v2/inventory/{picking_id}').status_code, 200)
+        self.assertEqual(self.api('HEAD', '/api/v2/inventory/name:NO-SUCH-PICKING').status_code, 404)
+
+    def test_batch_and_validate(self):
+        bad_product = {**self._picking_vals(), 'moves': [{'product_id': True}]}
+        missing = {**self._picking_vals(), 'location_id': False}
+
+        result = self.api('POST', '/api/v2/inventory/batch', {
+            'pickings': [self._picking_vals(2), self._picking_vals(3), bad_product, missing, 'picking'],
+        }).json()
+
+        self.assertEqual((result['created'], result['failed']), (2, 3))
+        ids = [r['id'] for r in result['results'][:2]]
+
+        response = self.api('PATCH', '/api/v2/inventory/validate', {'ids': ids + [0]})
+        self.assertEqual(response.json()['validated'], ids)
+        self.assertEqual(response.json()['errors'], [{'id': 0, 'message': 'Picking not found'}])
+
+        pickings = self.env['stock.picking'].browse(ids)
+        self.assertEqual(set(pickings.mapped('state')), {'done'})
+        self.assertEqual(sorted(pickings.move_ids.mapped('quantity')), [2, 3])
+
+        detail = self.api('GET', f'/api/v2/inventory/{ids[0]}').json()['data']
+        self.assertEqual(detail['moves'][0]['done_qty'], 2)
+
+        for ids in ('all', [True]):
+            response = self.api('PATCH', '/api/v2/inventory/validate', {'ids': ids})
+            self.assertEqual(response.status_code, 400)
+
+    def test_validate_job_ids(self):
+        payload = {'operation': 'stock_picking_validate', 'payload': {'ids': [True]}}
+        self.assertEqual(self.api('POST', '/api/v2/jobs', payload).status_code, 400)
+
+        payload['payload']['ids'] = [0]
+        self.assertEqual(self.api('POST', '/api/v2/jobs', payload).status_code, 202)
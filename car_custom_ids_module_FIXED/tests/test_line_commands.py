@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.api_v2_common.tools import prepare_line_commands
+
+
+@tagged('post_install', '-at_install')
+class TestLineCommands(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'Line Vendor'})
+        cls.products = cls.env['product.product'].create([
+            {'name': f'Line Product {i}'} for i in range(20)
+        ])
+        cls.order = cls.env['purchase.order'].create({
+            'partner_id': cls.vendor.id,
+            'order_line': [
+                (0, 0, {'product_id': cls.products[i % 20].id, 'product_qty': 1, 'price_unit': 1})
+                for i in range(1200)
+            ],
+        })
+
+    def _prepare(self, payload):
+        return prepare_line_commands(
+            self.order, 'order_line', payload,
+            update_vals=lambda line: {'product_qty': line.get('quantity')},
+            create_vals=lambda line, product: {'product_id': product.id, 'product_qty': 1},
+        )
+
+    def test_large_diff_query_budget(self):
+        line_ids = self.order.order_line.ids
+        payload = {
+            'update_lines': [{'line_id': i, 'quantity': 2} for i in line_ids[:600]],
+            'delete_lines': line_ids[600:900],
+            'new_lines': [{'product_id': self.products[i % 20].id} for i in range(500)],
+        }
+        self.env.invalidate_all()
+
+        # One query for the lines of the order, one for the products
+        with self.assertQueryCount(2):
+            commands, error = self._prepare(payload)
+
+        self.assertIsNone(error)
+        self.assertEqual(len(commands), 1400)
+
+        self.order.write({'order_line': commands})
+        self.assertEqual(len(self.order.order_line), 1400)
+
+    def test_rejects_foreign_and_bool_ids(self):
+        other = self.order.copy()
+        line_id = self.order.order_line[0].id
+
+        _commands, error = self._prepare({'delete_lines': [other.order_line[0].id]})
+        self.assertIn("do not belong", error)
+
+        for payload in (
+            {'delete_lines': [True]},
+            {'update_lines': [{'line_id': False}]},
+            {'new_lines': [{'product_id': True}]},
+        ):
+            commands, error = self._prepare(payload)
+            self.assertIsNone(commands)
+            self.assertTrue(error)
+
+        _commands, error = self._prepare({
+            'update_lines': [{'line_id': line_id}],
+            'delete_lines': [line_id],
+        })
+        self.assertIn("both updated and deleted", error)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.api_v2_common.tools import serialize
+
+
+@tagged('post_install', '-at_install')
+class TestPickingValidate(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product = cls.env['product.product'].create({
+            'name': 'API Test Product',
+            'is_storable': True,
+        })
+        cls.picking_type = cls.env.ref('stock.picking_type_in')
+
+    def _create_picking(self, quantity):
+        return self.env['stock.picking'].create({
+            'picking_type_id': self.picking_type.id,
+            'location_id': self.picking_type.default_location_src_id.id,
+            'location_dest_id': self.picking_type.default_location_dest_id.id,
+            'move_ids': [(0, 0, {
+                'name': self.product.name,
+                'product_id': self.product.id,
+                'product_uom_qty': quantity,
+                'product_uom': self.product.uom_id.id,
+                'location_id': self.picking_type.default_location_src_id.id,
+                'location_dest_id': self.picking_type.default_location_dest_id.id,
+            })],
+        })
+
+    def test_api_validate(self):
+        picking = self._create_picking(3)
+
+        picking._api_validate()
+
+        self.assertEqual(picking.state, 'done')
+        self.assertEqual(picking.move_ids.quantity, 3)
+        self.assertTrue(picking.move_ids.picked)
+
+    def test_api_validate_batch(self):
+        pickings = self._create_picking(2) | self._create_picking(5)
+        done = self._create_picking(1)
+        done._api_validate()
+
+        errors = (pickings | done)._api_validate_batch()
+
+        self.assertEqual(list(errors), [done.id])
+        self.assertEqual(set(pickings.mapped('state')), {'done'})
+        self.assertEqual(sorted(pickings.move_ids.mapped('quantity')), [2, 5])
+
+    def test_validate_job(self):
+        picking = self._create_picking(4)
+        job = self.env['api.job'].create({
+            'operation': 'stock_picking_validate',
+            'payload': {'ids': [picking.id, 0]},
+        })
+
+        job._run_chunk()
+
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(job.failed, 1)
+        self.assertEqual(picking.state, 'done')
+
+    def test_serialize_moves(self):
+        picking = self._create_picking(3)
+        picking._api_validate()
+
+        data = serialize('stock.picking.detail', picking)[0]
+
+        self.assertEqual(data['moves'][0]['quantity'], 3)
+        self.assertEqual(data['moves'][0]['done_qty'], 3)
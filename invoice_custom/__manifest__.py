@@ -1,7 +1,7 @@
 {
     'name': 'Invoice Custom',
     'version': '1.0',
-    'depends': ['account', 'hospital_yk'],
+    'depends': ['account', 'hospital_yk', 'api_v2_common'],
     'author': 'Yusuf Khan',
     'category': 'Accounting',
     'description': 'Customizations for Invoices',
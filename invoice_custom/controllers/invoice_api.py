@@ -2,94 +2,169 @@
 
 import json
 import logging
-from odoo import http
+from odoo import fields, http
 from odoo.http import request
 
+from odoo.addons.api_v2_common.tools import (
+    Field, Many, count_collection, get_validators, instrument, json_response,
+    not_modified_response, parse_fieldset, parse_filters, prepare_line_commands,
+    rate_limit, register_serializer, resolve_record, search_collection,
+    serialize, set_validators,
+)
+
 _logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('account.move', {
+    'id': 'id',
+    'name': 'name',
+    'customer': Field('partner_id.name', empty=None),
+    'state': 'state',
+    'invoice_date': 'invoice_date',
+    'amount_total': 'amount_total',
+    'currency': Field('currency_id.name', empty=None),
+})
+
+register_serializer('account.move.detail', {
+    'id': 'id',
+    'name': 'name',
+    'state': 'state',
+    'partner': Field('partner_id.name', empty=None),
+    'invoice_date': 'invoice_date',
+    'amount_total': 'amount_total',
+    'lines': Many('invoice_line_ids', 'account.move.line'),
+})
+
+register_serializer('account.move.line', {
+    'line_id': 'id',
+    'product_id': 'product_id.id',
+    'product': 'product_id.name',
+    'quantity': 'quantity',
+    'price_unit': 'price_unit',
+    'subtotal': 'price_subtotal',
+})
+
+# ---------------------------------------------------
+# Filters (query parameter → (field, operator))
+# ---------------------------------------------------
+INVOICE_FILTERS = {
+    'state': ('state', 'in'),
+    'partner_id': ('partner_id', 'in'),
+    'date_from': ('invoice_date', '>='),
+    'date_to': ('invoice_date', '<='),
+}
+
+INVOICE_ORDER_FIELDS = ('id', 'name', 'invoice_date', 'amount_total', 'state')
+
 
 class InvoiceRestAPI(http.Controller):
 
     # ---------------------------------------------------
-    # Helper → Get Invoice by ID or NAME
+    # Helper → Get Invoice by ID or NAME (id:/name: prefixes)
     # ---------------------------------------------------
     def _get_invoice(self, identifier):
-        Invoice = request.env['account.move'].sudo()
-
-        if str(identifier).isdigit():
-            inv = Invoice.browse(int(identifier))
-            if inv.exists():
-                return inv
-
-        return Invoice.search([
-            ('name', '=', identifier),
-            ('move_type', '=', 'out_invoice')
-        ], limit=1)
+        return resolve_record(request.env['account.move'].sudo(), identifier)
 
     # ===================================================
     # GET → All Invoices
     # ===================================================
     @http.route('/api/v2/invoices', type='http', auth='user',
                 methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
     def get_invoices(self, **kwargs):
-        invoices = request.env['account.move'].sudo().search([
-            ('move_type', '=', 'out_invoice')
-        ])
-
-        data = [{
-            'id': inv.id,
-            'name': inv.name,
-            'customer': inv.partner_id.name if inv.partner_id else None,
-            'state': inv.state,
-            'invoice_date': inv.invoice_date,
-            'amount_total': inv.amount_total,
-            'currency': inv.currency_id.name if inv.currency_id else None,
-        } for inv in invoices]
+        try:
+            Move = request.env['account.move'].sudo()
+            domain, order = parse_filters(Move, kwargs, INVOICE_FILTERS, INVOICE_ORDER_FIELDS)
+            invoices, sync = search_collection(
+                Move, [('move_type', '=', 'out_invoice')] + domain, kwargs,
+                order=order, scope='out_invoice',
+            )
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
 
-        return request.make_json_response({
+        data = serialize('account.move', invoices)
+
+        return json_response({
             'status': 'success',
             'count': len(data),
-            'data': data
+            'data': data,
+            **sync
         })
 
+    # ===================================================
+    # GET → Count Invoices (same filters, no data)
+    # ===================================================
+    @http.route('/api/v2/invoices/count', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    def count_invoices(self, **kwargs):
+        try:
+            Move = request.env['account.move'].sudo()
+            domain, _order = parse_filters(Move, kwargs, INVOICE_FILTERS, INVOICE_ORDER_FIELDS)
+            count = count_collection(Move, [('move_type', '=', 'out_invoice')] + domain, kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        return request.make_json_response({'status': 'success', 'count': count})
+
     # ===================================================
     # GET → Single Invoice
     # ===================================================
     @http.route('/api/v2/invoices/<string:identifier>', type='http',
-                auth='user', methods=['GET'], csrf=False)
+                auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def get_invoice(self, identifier, **kwargs):
         inv = self._get_invoice(identifier)
 
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if inv else 404)
+
         if not inv:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Invoice not found'},
                 status=404
             )
 
-        data = {
-            'id': inv.id,
-            'name': inv.name,
-            'state': inv.state,
-            'partner': inv.partner_id.name if inv.partner_id else None,
-            'invoice_date': inv.invoice_date,
-            'amount_total': inv.amount_total,
-            'lines': [{
-                'line_id': l.id,
-                'product_id': l.product_id.id,
-                'product': l.product_id.name,
-                'quantity': l.quantity,
-                'price_unit': l.price_unit,
-                'subtotal': l.price_subtotal,
-            } for l in inv.invoice_line_ids]
-        }
+        try:
+            keys = parse_fieldset('account.move.detail', kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        # The lines are only read (and part of the ETag) when they are sent
+        lines_field = 'line_ids' if keys is None or 'lines' in keys else None
+
+        # Unchanged since the client's copy → 304 without serializing
+        etag, last_modified = get_validators(inv, lines_field, keys)
+        not_modified = not_modified_response(etag, last_modified)
+        if not_modified:
+            return not_modified
 
-        return request.make_json_response({'status': 'success', 'data': data})
+        data = serialize('account.move.detail', inv, keys)[0]
+
+        return set_validators(
+            json_response({'status': 'success', 'data': data}),
+            etag, last_modified
+        )
 
     # ===================================================
     # POST → Create Invoice
     # ===================================================
     @http.route('/api/v2/invoices', type='http', auth='user',
                 methods=['POST'], csrf=False)
+    @instrument
     def create_invoice(self, **kwargs):
         try:
             payload = json.loads(request.httprequest.data or '{}')
@@ -142,11 +217,123 @@ class InvoiceRestAPI(http.Controller):
                 status=500
             )
 
+    # ===================================================
+    # POST → Batch Create & Post Invoices
+    # ===================================================
+    @http.route('/api/v2/invoices/batch', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def batch_invoices(self, **kwargs):
+        try:
+            payload = json.loads(request.httprequest.data or '[]')
+        except ValueError:
+            payload = None
+
+        invoices = payload.get('invoices') if isinstance(payload, dict) else payload
+        if not isinstance(invoices, list) or not invoices:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'A non-empty list of invoices is required'},
+                status=400
+            )
+
+        env = request.env
+        valid = [i for i in invoices if isinstance(i, dict)]
+
+        # One query each for partners and products; browse().exists() keeps
+        # archived records valid (type(...) is int leaves out booleans)
+        partner_ids = {i.get('partner_id') for i in valid if type(i.get('partner_id')) is int}
+        partners = set(env['res.partner'].sudo().browse(partner_ids).exists().ids)
+        product_ids = {
+            line.get('product_id')
+            for i in valid for line in i.get('invoice_lines') or []
+            if isinstance(line, dict) and type(line.get('product_id')) is int
+        }
+        products = {p.id: p for p in env['product.product'].sudo().browse(product_ids).exists()}
+
+        today = fields.Date.context_today(env.user)
+        results = [None] * len(invoices)
+        to_create = []   # (index, vals)
+
+        for index, invoice in enumerate(invoices):
+            if not isinstance(invoice, dict) or not invoice.get('partner_id') or not invoice.get('invoice_lines'):
+                results[index] = {'index': index, 'status': 'error',
+                                  'message': 'partner_id and invoice_lines required'}
+                continue
+
+            if type(invoice['partner_id']) is not int or invoice['partner_id'] not in partners:
+                results[index] = {'index': index, 'status': 'error', 'message': 'Invalid partner_id'}
+                continue
+
+            lines = []
+            for line in invoice['invoice_lines']:
+                product_id = line.get('product_id') if isinstance(line, dict) else None
+                product = products.get(product_id) if type(product_id) is int else None
+                if not product:
+                    results[index] = {'index': index, 'status': 'error',
+                                      'message': f"Invalid product_id {product_id}"}
+                    break
+
+                lines.append((0, 0, {
+                    'product_id': product.id,
+                    'quantity': line.get('quantity', 1),
+                    'price_unit': line.get('price_unit', product.lst_price),
+                }))
+
+            if results[index]:
+                continue
+
+            vals = {
+                'move_type': 'out_invoice',
+                'partner_id': invoice['partner_id'],
+                'invoice_line_ids': lines,
+                'confirmed_by': invoice.get('confirmed_by') or today,
+            }
+            if invoice.get('invoice_date'):
+                vals['invoice_date'] = invoice['invoice_date']
+            to_create.append((index, vals))
+
+        Move = env['account.move'].sudo()
+
+        # 1️⃣ Create everything at once, isolate failing records only if needed
+        created = []   # (index, move)
+        if to_create:
+            try:
+                with env.cr.savepoint():
+                    moves = Move.create([vals for _index, vals in to_create])
+                created = list(zip([index for index, _vals in to_create], moves))
+            except Exception:
+                for index, vals in to_create:
+                    try:
+                        with env.cr.savepoint():
+                            created.append((index, Move.create(vals)))
+                    except Exception as e:
+                        results[index] = {'index': index, 'status': 'error', 'message': str(e)}
+
+        # 2️⃣ Post the whole recordset: sequence locking and checks run once
+        if created:
+            errors = Move.browse([move.id for _index, move in created])._api_post_batch()
+
+            for index, move in created:
+                if move.id in errors:
+                    results[index] = {'index': index, 'status': 'error', 'id': move.id,
+                                      'message': errors[move.id]}
+                elif not results[index]:
+                    results[index] = {'index': index, 'status': 'posted', 'id': move.id, 'name': move.name}
+
+        return request.make_json_response({
+            'status': 'success',
+            'posted': sum(1 for r in results if r['status'] == 'posted'),
+            'failed': sum(1 for r in results if r['status'] == 'error'),
+            'results': results,
+        })
+
     # ===================================================
     # PUT → Full Update Invoice (LINES)
     # ===================================================
     @http.route('/api/v2/invoices/<string:identifier>', type='http',
                 auth='user', methods=['PUT'], csrf=False)
+    @instrument
     def put_invoice(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         inv = self._get_invoice(identifier)
@@ -163,23 +350,23 @@ class InvoiceRestAPI(http.Controller):
                 status=400
             )
 
-        commands = []
-
-        for line in payload.get('update_lines', []):
-            commands.append((1, line['line_id'], {
+        commands, error = prepare_line_commands(
+            inv, 'invoice_line_ids', payload,
+            update_vals=lambda line: {
                 'quantity': line.get('quantity'),
                 'price_unit': line.get('price_unit'),
-            }))
-
-        for line in payload.get('new_lines', []):
-            commands.append((0, 0, {
-                'product_id': line['product_id'],
+            },
+            create_vals=lambda line, product: {
+                'product_id': product.id,
                 'quantity': line.get('quantity', 1),
                 'price_unit': line.get('price_unit', 0),
-            }))
-
-        for line_id in payload.get('delete_lines', []):
-            commands.append((2, line_id, 0))
+            },
+        )
+        if error:
+            return request.make_json_response(
+                {'status': 'error', 'message': error},
+                status=400
+            )
 
         if commands:
             inv.write({'invoice_line_ids': commands})
@@ -193,6 +380,7 @@ class InvoiceRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/invoices/<string:identifier>', type='http',
                 auth='user', methods=['PATCH'], csrf=False)
+    @instrument
     def patch_invoice(self, identifier, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         inv = self._get_invoice(identifier)
@@ -234,6 +422,7 @@ class InvoiceRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/invoices/<string:identifier>', type='http',
                 auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_invoice(self, identifier, **kwargs):
         inv = self._get_invoice(identifier)
 
@@ -260,12 +449,17 @@ class InvoiceRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/invoices', type='http',
                 auth='user', methods=['OPTIONS'], csrf=False)
+    @instrument
     def options_invoices(self, **kwargs):
         info = {
             'collection': {
                 'endpoint': '/api/v2/invoices',
                 'methods': ['GET', 'POST', 'OPTIONS'],
             },
+            'batch': {
+                'endpoint': '/api/v2/invoices/batch',
+                'methods': ['POST'],
+            },
             'single_resource': {
                 'endpoint': '/api/v2/invoices/<id_or_name>',
                 'methods': ['GET', 'PUT', 'PATCH', 'DELETE'],
@@ -1 +1,2 @@
-from .import inherit_invoice
\ No newline at end of file
+from .import inherit_invoice
+from . import inherit_api_job
@@ -0,0 +1,18 @@
+from odoo import models, fields
+
+
+class ApiJob(models.Model):
+    _inherit = 'api.job'
+
+    operation = fields.Selection(selection_add=[
+        ('invoice_post', 'Post Invoices'),
+    ], ondelete={'invoice_post': 'cascade'})
+
+    def _run_invoice_post(self, ids):
+        moves, errors = self._browse_payload_ids('account.move', ids)
+        for move in moves.filtered(lambda m: m.move_type != 'out_invoice' or m.state != 'draft'):
+            errors[move.id] = 'Only draft customer invoices can be posted'
+        todo = moves.filtered(lambda m: m.id not in errors)
+        if todo:
+            errors.update(todo._api_post_batch())
+        return errors
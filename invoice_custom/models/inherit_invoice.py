@@ -2,7 +2,7 @@ from odoo import models, fields, api
 from odoo.exceptions import ValidationError, UserError, AccessError
 
 class AccountMove(models.Model):
-    _inherit = 'account.move'
+    _inherit = ['account.move', 'api.sync.mixin']
 
     confirmed_by = fields.Date(
         string="Confirmed Date",
@@ -17,6 +17,35 @@ class AccountMove(models.Model):
     #     copy=False
     # )
 
+    # /api/v2/invoices filters (always on move_type): ?state= and ?partner_id= with a date range
+    _api_filter_indexes = [
+        ('move_type', 'state', 'invoice_date'),
+        ('move_type', 'partner_id', 'invoice_date'),
+    ]
+    # The invoice feed only reports deleted customer invoices
+    _api_scope_field = 'move_type'
+
+    @api.model
+    def _api_name_domain(self, name):
+        # /api/v2/invoices/<name> only addresses customer invoices
+        return super()._api_name_domain(name) + [('move_type', '=', 'out_invoice')]
+
+    def _api_post_batch(self):
+        """Post the moves at once (sequence locking and checks run once),
+        isolating the failing ones → ``{move_id: error message}``."""
+        errors = {}
+        try:
+            with self.env.cr.savepoint():
+                self.action_post()
+        except Exception:
+            for move in self:
+                try:
+                    with self.env.cr.savepoint():
+                        move.action_post()
+                except Exception as e:
+                    errors[move.id] = str(e)
+        return errors
+
 
     # def action_post(self):
     #     res = super().action_post()
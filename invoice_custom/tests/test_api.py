@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.addons.api_v2_common.tests.common import ApiHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestInvoiceRoutes(AccountTestInvoicingCommon, ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        company = cls.company_data['company']
+        cls.env.ref('base.user_admin').write({
+            'company_ids': [(4, company.id)],
+            'company_id': company.id,
+        })
+        cls.invoice = cls._create_move('out_invoice')
+        cls.bill = cls._create_move('in_invoice')
+        (cls.invoice | cls.bill).action_post()
+
+    @classmethod
+    def _create_move(cls, move_type):
+        return cls.env['account.move'].create({
+            'move_type': move_type,
+            'partner_id': cls.partner_a.id,
+            'invoice_date': fields.Date.today(),
+            'confirmed_by': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {'product_id': cls.product_a.id, 'price_unit': 100})],
+        })
+
+    def test_count(self):
+        # Only customer invoices are counted
+        response = self.api('GET', '/api/v2/invoices/count', params={'partner_id': self.partner_a.id})
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_head(self):
+        self.assertEqual(self.api('HEAD', f'/api/v2/invoices/name:{self.invoice.name}').status_code, 200)
+        self.assertEqual(self.api('HEAD', f'/api/v2/invoices/name:{self.bill.name}').status_code, 404)
+
+    def test_sync_reports_deleted_invoices_only(self):
+        invoice = self._create_move('out_invoice')
+        bill = self._create_move('in_invoice')
+        deleted_ids = [invoice.id, bill.id]
+        (invoice | bill).unlink()
+
+        response = self.api('GET', '/api/v2/invoices', params={
+            'updated_since': '2000-01-01T00:00:00', 'partner_id': self.partner_a.id,
+        }).json()
+
+        self.assertEqual([inv['id'] for inv in response['data']], [self.invoice.id])
+        deleted = [t['id'] for t in response['deleted']]
+        self.assertIn(deleted_ids[0], deleted)
+        self.assertNotIn(deleted_ids[1], deleted)
+
+    def test_batch(self):
+        self.product_a.action_archive()
+        invoices = [
+            {'partner_id': self.partner_a.id, 'invoice_lines': [{'product_id': self.product_a.id, 'price_unit': 50}]},
+            {'partner_id': [self.partner_a.id], 'invoice_lines': [{'product_id': self.product_a.id}]},
+            {'partner_id': self.partner_a.id, 'invoice_lines': [{'product_id': True}]},
+        ]
+
+        result = self.api('POST', '/api/v2/invoices/batch', {'invoices': invoices}).json()
+
+        self.assertEqual((result['posted'], result['failed']), (1, 2))
+        move = self.env['account.move'].browse(result['results'][0]['id'])
+        self.assertEqual(move.state, 'posted')
+        self.assertEqual(move.amount_untaxed, 50)
+        self.assertTrue(move.confirmed_by)
@@ -11,6 +11,7 @@
         "hr_holidays",
         "account",
         "mail",
+        "api_v2_common",
     ],
     "data": [
         # =====================
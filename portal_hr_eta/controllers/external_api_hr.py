@@ -8,8 +8,25 @@ from odoo import http
 from odoo.http import request
 import base64
 
+from odoo.addons.api_v2_common.tools import (
+    Field, count_collection, instrument, json_response, rate_limit,
+    register_serializer, search_collection, serialize,
+)
+
 _logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('hr.employee', {
+    'id': 'id',
+    'name': 'name',
+    'job_title': 'job_title',
+    'work_email': 'work_email',
+    'work_phone': 'work_phone',
+    'department': Field('department_id.name', empty=None),
+})
+
 
 class EmployeeRestAPI(http.Controller):
 
@@ -17,47 +34,63 @@ class EmployeeRestAPI(http.Controller):
     # GET → All Employees
     # ===================================================
     @http.route('/api/v2/employees', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
     def get_employees(self, **kwargs):
-        employees = request.env['hr.employee'].sudo().search([])
-        data = [{
-            'id': e.id,
-            'name': e.name,
-            'job_title': e.job_title,
-            'work_email': e.work_email,
-            'work_phone': e.work_phone,
-            'department': e.department_id.name if e.department_id else None,
-        } for e in employees]
-
-        return request.make_json_response({'status': 'success', 'data': data})
+        try:
+            employees, sync = search_collection(request.env['hr.employee'].sudo(), [], kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+        data = serialize('hr.employee', employees)
+
+        return json_response({'status': 'success', 'data': data, **sync})
+
+    # ===================================================
+    # GET → Count Employees (no data)
+    # ===================================================
+    @http.route('/api/v2/employees/count', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrument
+    def count_employees(self, **kwargs):
+        try:
+            count = count_collection(request.env['hr.employee'].sudo(), [], kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        return request.make_json_response({'status': 'success', 'count': count})
 
     # ===================================================
     # GET → Single Employee
     # ===================================================
-    @http.route('/api/v2/employees/<int:employee_id>', type='http', auth='user', methods=['GET'], csrf=False)
+    @http.route('/api/v2/employees/<int:employee_id>', type='http', auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def get_employee(self, employee_id, **kwargs):
-        employee = request.env['hr.employee'].sudo().browse(employee_id)
+        employee = request.env['hr.employee'].sudo().browse(employee_id).exists()
 
-        if not employee.exists():
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if employee else 404)
+
+        if not employee:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Employee not found'},
                 status=404
             )
 
-        data = {
-            'id': employee.id,
-            'name': employee.name,
-            'job_title': employee.job_title,
-            'work_email': employee.work_email,
-            'work_phone': employee.work_phone,
-            'department': employee.department_id.name if employee.department_id else None,
-        }
+        data = serialize('hr.employee', employee)[0]
 
-        return request.make_json_response({'status': 'success', 'data': data})
+        return json_response({'status': 'success', 'data': data})
 
     # ===================================================
     # POST → Create Employee with Image
     # ===================================================
     @http.route('/api/v2/employees', type='http', auth='user', methods=['POST', 'PATCH'], csrf=False)
+    @instrument
     def create_employee(self, **kwargs):
         try:
             # 1️⃣ Read form fields (NOT JSON)
@@ -110,6 +143,7 @@ class EmployeeRestAPI(http.Controller):
     # PUT → Full Update Employee (JSON ONLY)
     # ===================================================
     @http.route('/api/v2/employees/<int:employee_id>', type='http', auth='user', methods=['PUT'], csrf=False)
+    @instrument
     def put_employee(self, employee_id, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         employee = request.env['hr.employee'].sudo().browse(employee_id)
@@ -138,6 +172,7 @@ class EmployeeRestAPI(http.Controller):
     # PATCH → Partial Update Employee (JSON ONLY)
     # ===================================================
     @http.route('/api/v2/employees/<int:employee_id>', type='http', auth='user', methods=['PATCH'], csrf=False)
+    @instrument
     def patch_employee(self, employee_id, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         employee = request.env['hr.employee'].sudo().browse(employee_id)
@@ -174,6 +209,7 @@ class EmployeeRestAPI(http.Controller):
     # DELETE → Delete Employee
     # ===================================================
     @http.route('/api/v2/employees/<int:employee_id>', type='http', auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_employee(self, employee_id, **kwargs):
         employee = request.env['hr.employee'].sudo().browse(employee_id)
 
@@ -194,6 +230,7 @@ class EmployeeRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/employees/<int:employee_id>/image', type='http',
                 auth='user', methods=['PUT', 'POST'], csrf=False)
+    @instrument
     def update_employee_image(self, employee_id, **kwargs):
         employee = request.env['hr.employee'].sudo().browse(employee_id)
 
@@ -224,6 +261,7 @@ class EmployeeRestAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/employees/<int:employee_id>/image', type='http',
                 auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_employee_image(self, employee_id, **kwargs):
         employee = request.env['hr.employee'].sudo().browse(employee_id)
 
@@ -243,6 +281,7 @@ class EmployeeRestAPI(http.Controller):
     # OPTIONS → API Metadata
     # ===================================================
     @http.route('/api/v2/employees', type='http', auth='user', methods=['OPTIONS'], csrf=False)
+    @instrument
     def options_employees(self, **kwargs):
         info = {
             'collection': {
@@ -7,8 +7,46 @@ import logging
 from odoo import http
 from odoo.http import request
 
+from odoo.addons.api_v2_common.tools import (
+    count_collection, instrument, json_response, rate_limit,
+    register_serializer, search_collection, serialize,
+)
+
 _logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('hr.leave', {
+    'id': 'id',
+    'employee': 'employee_id.name',
+    'employee_id': 'employee_id.id',
+    'leave_type': 'holiday_status_id.name',
+    'leave_type_id': 'holiday_status_id.id',
+    'date_from': 'date_from',
+    'date_to': 'date_to',
+    'state': 'state',
+    'days': 'number_of_days',
+})
+
+register_serializer('hr.leave.detail', {
+    'id': 'id',
+    'employee': 'employee_id.name',
+    'leave_type': 'holiday_status_id.name',
+    'date_from': 'date_from',
+    'date_to': 'date_to',
+    'state': 'state',
+    'days': 'number_of_days',
+})
+
+register_serializer('hr.leave.attachment', {
+    'id': 'id',
+    'name': 'name',
+    'mimetype': 'mimetype',
+    'size': 'file_size',
+    'created_on': 'create_date',
+})
+
 
 class TimeOffRestAPI(http.Controller):
 
@@ -16,59 +54,63 @@ class TimeOffRestAPI(http.Controller):
     # GET → All Time Off Requests
     # ===================================================
     @http.route('/api/v2/time_off', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
     def get_time_off(self, **kwargs):
-        leaves = request.env['hr.leave'].sudo().search([])
-        data = [{
-            'id': l.id,
-            'employee': l.employee_id.name,
-            'employee_id': l.employee_id.id,
-            'leave_type': l.holiday_status_id.name,
-            'leave_type_id': l.holiday_status_id.id,
-            'date_from': l.date_from,
-            'date_to': l.date_to,
-            'state': l.state,
-            'days': l.number_of_days,
-        } for l in leaves]
-
-        return request.make_json_response({'status': 'success', 'data': data})
+        try:
+            leaves, sync = search_collection(request.env['hr.leave'].sudo(), [], kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+        data = serialize('hr.leave', leaves)
+
+        return json_response({'status': 'success', 'data': data, **sync})
+
+    # ===================================================
+    # GET → Count Time Off Requests (no data)
+    # ===================================================
+    @http.route('/api/v2/time_off/count', type='http', auth='user', methods=['GET'], csrf=False)
+    @instrument
+    def count_time_off(self, **kwargs):
+        try:
+            count = count_collection(request.env['hr.leave'].sudo(), [], kwargs)
+        except ValueError as e:
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=400
+            )
+
+        return request.make_json_response({'status': 'success', 'count': count})
 
     # ===================================================
     # GET → Single Time Off
     # ===================================================
-    @http.route('/api/v2/time_off/<int:leave_id>', type='http', auth='user', methods=['GET'], csrf=False)
+    @http.route('/api/v2/time_off/<int:leave_id>', type='http', auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def get_single_time_off(self, leave_id, **kwargs):
-        leave = request.env['hr.leave'].sudo().browse(leave_id)
+        leave = request.env['hr.leave'].sudo().browse(leave_id).exists()
 
-        if not leave.exists():
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if leave else 404)
+
+        if not leave:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Time off not found'},
                 status=404
             )
 
-        data = {
-            'id': leave.id,
-            'employee': leave.employee_id.name,
-            'leave_type': leave.holiday_status_id.name,
-            'date_from': leave.date_from,
-            'date_to': leave.date_to,
-            'state': leave.state,
-            'days': leave.number_of_days,
-        }
-
-        return request.make_json_response({'status': 'success', 'data': data})
+        data = serialize('hr.leave.detail', leave)[0]
 
-    # ===================================================
-    # HEAD → Check if Time Off exists
-    # ===================================================
-    @http.route('/api/v2/time_off/<int:leave_id>', type='http', auth='user', methods=['HEAD'], csrf=False)
-    def head_time_off(self, leave_id, **kwargs):
-        leave = request.env['hr.leave'].sudo().browse(leave_id)
-        return ('', 200) if leave.exists() else ('', 404)
+        return json_response({'status': 'success', 'data': data})
 
     # ===================================================
     # POST → Create Time Off (JSON ONLY)
     # ===================================================
     @http.route('/api/v2/time_off', type='http', auth='user', methods=['POST'], csrf=False)
+    @instrument
     def create_time_off(self, **kwargs):
         try:
             payload = json.loads(request.httprequest.data or '{}')
@@ -104,6 +146,7 @@ class TimeOffRestAPI(http.Controller):
     # PUT → Full Update Time Off
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>', type='http', auth='user', methods=['PUT'], csrf=False)
+    @instrument
     def put_time_off(self, leave_id, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         leave = request.env['hr.leave'].sudo().browse(leave_id)
@@ -132,6 +175,7 @@ class TimeOffRestAPI(http.Controller):
     # PATCH → Partial Update Time Off
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>', type='http', auth='user', methods=['PATCH'], csrf=False)
+    @instrument
     def patch_time_off(self, leave_id, **kwargs):
         payload = json.loads(request.httprequest.data or '{}')
         leave = request.env['hr.leave'].sudo().browse(leave_id)
@@ -161,6 +205,7 @@ class TimeOffRestAPI(http.Controller):
     # DELETE → Delete Time Off
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>', type='http', auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_time_off(self, leave_id, **kwargs):
         leave = request.env['hr.leave'].sudo().browse(leave_id)
 
@@ -188,27 +233,23 @@ class TimeOffAttachmentAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>/attachments',
                 type='http', auth='user', methods=['GET'], csrf=False)
+    @instrument
     def list_attachments(self, leave_id, **kwargs):
         attachments = request.env['ir.attachment'].sudo().search([
             ('res_model', '=', 'hr.leave'),
             ('res_id', '=', leave_id)
         ])
 
-        data = [{
-            'id': att.id,
-            'name': att.name,
-            'mimetype': att.mimetype,
-            'size': att.file_size,
-            'created_on': att.create_date,
-        } for att in attachments]
+        data = serialize('hr.leave.attachment', attachments)
 
-        return request.make_json_response({'status': 'success', 'data': data})
+        return json_response({'status': 'success', 'data': data})
 
     # ===================================================
     # POST → Upload attachment
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>/attachments',
                 type='http', auth='user', methods=['POST'], csrf=False)
+    @instrument
     def upload_attachment(self, leave_id, **kwargs):
         file = request.httprequest.files.get('file')
 
@@ -235,11 +276,17 @@ class TimeOffAttachmentAPI(http.Controller):
     # GET → Download attachment
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>/attachments/<int:attachment_id>',
-                type='http', auth='user', methods=['GET'], csrf=False)
+                type='http', auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
     def download_attachment(self, leave_id, attachment_id, **kwargs):
-        attachment = request.env['ir.attachment'].sudo().browse(attachment_id)
+        attachment = request.env['ir.attachment'].sudo().browse(attachment_id).exists()
+        found = attachment and attachment.res_id == leave_id
 
-        if not attachment.exists() or attachment.res_id != leave_id:
+        # HEAD → existence check only, the file is not read
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if found else 404)
+
+        if not found:
             return request.make_json_response(
                 {'status': 'error', 'message': 'Attachment not found'},
                 status=404
@@ -258,6 +305,7 @@ class TimeOffAttachmentAPI(http.Controller):
     # ===================================================
     @http.route('/api/v2/time_off/<int:leave_id>/attachments/<int:attachment_id>',
                 type='http', auth='user', methods=['DELETE'], csrf=False)
+    @instrument
     def delete_attachment(self, leave_id, attachment_id, **kwargs):
         attachment = request.env['ir.attachment'].sudo().browse(attachment_id)
 
@@ -1,7 +1,7 @@
 from odoo import models, fields
 
 class HrEmployee(models.Model):
-    _inherit = 'hr.employee'
+    _inherit = ['hr.employee', 'api.sync.mixin']
 
     employee_ids = fields.One2many(
         'hr.employee',
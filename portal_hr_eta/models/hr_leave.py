@@ -1,7 +1,7 @@
 from odoo import models
 
 class HrLeave(models.Model):
-    _inherit = 'hr.leave'
+    _inherit = ['hr.leave', 'api.sync.mixin']
 
     # ❌ CUSTOM ATTACHMENT FIELD (DISABLED)
     # This is replaced by Odoo native "Supporting Documents"
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import base64
+
+from odoo.tests import tagged
+
+from odoo.addons.api_v2_common.tests.common import ApiHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestEmployeeRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employee = cls.env['hr.employee'].create({'name': 'API Employee'})
+
+    def test_count(self):
+        response = self.api('GET', '/api/v2/employees/count')
+        self.assertEqual(response.json()['count'], self.env['hr.employee'].search_count([]))
+
+    def test_head(self):
+        self.assertEqual(self.api('HEAD', f'/api/v2/employees/{self.employee.id}').status_code, 200)
+        self.assertEqual(self.api('HEAD', '/api/v2/employees/999999999').status_code, 404)
+
+    def test_sync(self):
+        deleted = self.env['hr.employee'].create({'name': 'API Leaver'})
+        deleted_id = deleted.id
+        deleted.unlink()
+
+        response = self.api('GET', '/api/v2/employees', params={'updated_since': '2000-01-01T00:00:00'}).json()
+
+        self.assertIn(self.employee.id, [e['id'] for e in response['data']])
+        self.assertIn(deleted_id, [t['id'] for t in response['deleted']])
+        self.assertTrue(response['sync_time'])
+
+
+@tagged('post_install', '-at_install')
+class TestTimeOffRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        employee = cls.env['hr.employee'].create({'name': 'API Time Off Employee'})
+        leave_type = cls.env['hr.leave.type'].create({
+            'name': 'API Leave',
+            'requires_allocation': 'no',
+        })
+        cls.leave = cls.env['hr.leave'].create({
+            'employee_id': employee.id,
+            'holiday_status_id': leave_type.id,
+            'request_date_from': '2026-03-02',
+            'request_date_to': '2026-03-03',
+        })
+        cls.attachment = cls.env['ir.attachment'].create({
+            'name': 'certificate.txt',
+            'datas': base64.b64encode(b'API certificate'),
+            'res_model': 'hr.leave',
+            'res_id': cls.leave.id,
+            'mimetype': 'text/plain',
+        })
+
+    def test_count(self):
+        response = self.api('GET', '/api/v2/time_off/count')
+        self.assertEqual(response.json()['count'], self.env['hr.leave'].search_count([]))
+
+    def test_head(self):
+        self.assertEqual(self.api('HEAD', f'/api/v2/time_off/{self.leave.id}').status_code, 200)
+        self.assertEqual(self.api('HEAD', '/api/v2/time_off/999999999').status_code, 404)
+
+    def test_attachment_download(self):
+        path = f'/api/v2/time_off/{self.leave.id}/attachments/{self.attachment.id}'
+
+        response = self.api('HEAD', path)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.content)
+
+        response = self.api('GET', path)
+        self.assertEqual(response.content, b'API certificate')
+
+        other_leave = f'/api/v2/time_off/{self.leave.id + 1}/attachments/{self.attachment.id}'
+        self.assertEqual(self.api('HEAD', other_leave).status_code, 404)
@@ -1,6 +1,6 @@
 {
     'name': 'Purchase Repeat Order',
-    'version': '1.0',
+    'version': '1.4',
     'category': 'Purchase',
     'summary': 'Repeat Purchase Orders with RO button',
     'description': """
@@ -8,7 +8,7 @@ Create repeated Purchase Orders with the same data.
 Adds RO button, Close button, and Smart Button to track repeated orders.
 """,
     'author': 'Yusuf',
-    'depends': ['purchase', 'stock', 'sale', 'hr', 'account', 'mail','base'],
+    'depends': ['purchase', 'stock', 'sale', 'hr', 'account', 'mail','base', 'api_v2_common'],
     'data': [
         'security/ir.model.access.csv',
         'data/sequence.xml',
@@ -16,6 +16,7 @@ Adds RO button, Close button, and Smart Button to track repeated orders.
         'data/email_template.xml',
         'views/por.xml',
         'views/subscription_order.xml',
+        'views/subscription_forecast.xml',
         'views/menu.xml',
     ],
     'installable': True,
@@ -0,0 +1,2 @@
+from . import subscription_api
+from . import purchase_repeat_api
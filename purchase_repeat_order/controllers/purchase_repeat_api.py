@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.api_v2_common.tools import (
+    Field, instrument, json_response, rate_limit, register_serializer,
+    resolve_record, serialize,
+)
+from odoo.addons.api_v2_common.tools.lines import _is_id
+
+_logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('purchase.order.family', {
+    'id': 'id',
+    'name': 'name',
+    'state': 'state',
+    'date_order': 'date_order',
+    'amount_total': 'amount_total',
+    'currency': Field('currency_id.name', empty=None),
+    'is_repeat': Field('repeat_origin_id', convert=bool),
+})
+
+
+class PurchaseRepeatRestAPI(http.Controller):
+
+    # ---------------------------------------------------
+    # Helper → Read {"ids": [...]} and split found / missing
+    # ---------------------------------------------------
+    def _get_orders_from_payload(self):
+        payload = json.loads(request.httprequest.data or '{}')
+        ids = payload.get('ids')
+
+        if not isinstance(ids, list) or not all(_is_id(i) for i in ids):
+            return None, None
+
+        # Each order is handled once, however often it is listed
+        ids = list(dict.fromkeys(ids))
+        orders = request.env['purchase.order'].sudo().browse(ids).exists()
+        found = set(orders.ids)
+        errors = [{'id': i, 'message': 'Purchase Order not found'} for i in ids if i not in found]
+        return orders, errors
+
+    # ===================================================
+    # GET → Repeat Family (BASE ORDER + ALL ITS REPEATS)
+    # ===================================================
+    @http.route('/api/v2/purchases/<string:identifier>/family', type='http',
+                auth='user', methods=['GET'], csrf=False)
+    @instrument
+    def get_purchase_family(self, identifier, **kwargs):
+        PurchaseOrder = request.env['purchase.order'].sudo()
+        po = resolve_record(PurchaseOrder, identifier)
+
+        if not po:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Purchase Order not found'},
+                status=404
+            )
+
+        base = po.repeat_origin_id or po
+        domain = po._get_repeat_family_domain()
+
+        orders = PurchaseOrder.search(domain, order='id')
+        groups = PurchaseOrder._read_group(
+            domain,
+            groupby=['currency_id'],
+            aggregates=['__count', 'amount_untaxed:sum', 'amount_total:sum'],
+        )
+
+        data = {
+            'base_id': base.id,
+            'base_name': base.name,
+            'orders': serialize('purchase.order.family', orders),
+            'totals': [{
+                'currency': currency.name if currency else None,
+                'count': count,
+                'amount_untaxed': amount_untaxed,
+                'amount_total': amount_total,
+            } for currency, count, amount_untaxed, amount_total in groups],
+        }
+
+        return json_response({'status': 'success', 'data': data})
+
+    # ===================================================
+    # POST → Repeat Many Purchase Orders
+    # ===================================================
+    @http.route('/api/v2/purchases/repeat', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def repeat_purchases(self, **kwargs):
+        orders, errors = self._get_orders_from_payload()
+
+        if orders is None:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'ids must be a list of integers'},
+                status=400
+            )
+
+        invalid = orders._get_repeat_errors()
+        errors += [{'id': order_id, 'message': message} for order_id, message in invalid.items()]
+        todo = orders.filtered(lambda o: o.id not in invalid)
+
+        try:
+            new_orders = todo._repeat_orders() if todo else todo
+        except Exception as e:
+            _logger.exception("Error repeating purchase orders")
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=500
+            )
+
+        data = [{
+            'source_id': source.id,
+            'id': new.id,
+            'name': new.name,
+        } for source, new in zip(todo, new_orders)]
+
+        return request.make_json_response({
+            'status': 'success',
+            'count': len(data),
+            'data': data,
+            'errors': errors,
+        }, status=201 if data else 200)
+
+    # ===================================================
+    # POST → Close Many Purchase Orders
+    # ===================================================
+    @http.route('/api/v2/purchases/close', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def close_purchases(self, **kwargs):
+        orders, errors = self._get_orders_from_payload()
+
+        if orders is None:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'ids must be a list of integers'},
+                status=400
+            )
+
+        try:
+            failed = orders._close_operations()
+        except Exception as e:
+            _logger.exception("Error closing purchase orders")
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=500
+            )
+
+        errors += [{'id': order_id, 'message': message} for order_id, message in failed.items()]
+
+        return request.make_json_response({
+            'status': 'success',
+            'closed': [order_id for order_id in orders.ids if order_id not in failed],
+            'errors': errors,
+        })
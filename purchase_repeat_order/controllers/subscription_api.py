@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.api_v2_common.tools import (
+    Field, Many, instrument, json_response, prepare_line_commands, rate_limit,
+    register_serializer, resolve_record, serialize,
+)
+from odoo.addons.api_v2_common.tools.lines import _is_id
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 80
+MAX_LIMIT = 1000
+
+# ---------------------------------------------------
+# Serializers
+# ---------------------------------------------------
+register_serializer('subscription.purchase.order', {
+    'id': 'id',
+    'name': 'name',
+    'vendor_id': 'vendor_id.id',
+    'vendor': 'vendor_id.name',
+    'state': 'state',
+    'frequency': 'frequency',
+    'next_invoice_date': 'next_invoice_date',
+    'amount': 'amount',
+    'currency': Field('currency_id.name', empty=None),
+})
+
+register_serializer('subscription.purchase.order.detail', {
+    'id': 'id',
+    'name': 'name',
+    'vendor_id': 'vendor_id.id',
+    'vendor': 'vendor_id.name',
+    'state': 'state',
+    'po_type': 'po_type',
+    'frequency': 'frequency',
+    'start_date': 'start_date',
+    'last_invoice_date': 'last_invoice_date',
+    'next_invoice_date': 'next_invoice_date',
+    'payment_method': 'payment_method',
+    'payment_type': 'payment_type',
+    'sub_amount': 'sub_amount',
+    'amount': 'amount',
+    'currency': Field('currency_id.name', empty=None),
+    'po_count': 'po_count',
+    'lines': Many('line_ids', 'subscription.purchase.order.line'),
+})
+
+register_serializer('subscription.purchase.order.line', {
+    'line_id': 'id',
+    'product_id': 'product_id.id',
+    'product': 'product_id.name',
+    'description': 'product_description',
+    'quantity': 'quantity',
+    'price_unit': 'unit_price',
+    'tax_id': Field('tax.id', empty=None),
+    'subtotal': 'sub_amount',
+    'total': 'amount',
+})
+
+
+class SubscriptionRestAPI(http.Controller):
+
+    # ---------------------------------------------------
+    # Helper → Get Subscription by ID or NAME (id:/name: prefixes)
+    # ---------------------------------------------------
+    def _get_subscription(self, identifier):
+        return resolve_record(request.env['subscription.purchase.order'].sudo(), identifier)
+
+    # ---------------------------------------------------
+    # Helper → Line values from payload
+    # ---------------------------------------------------
+    def _prepare_line_vals(self, line):
+        vals = {
+            'product_id': line.get('product_id'),
+            'quantity': line.get('quantity'),
+            'unit_price': line.get('price_unit'),
+            'unit': line.get('uom_id'),
+            'tax': line.get('tax_id'),
+            'product_description': line.get('description'),
+        }
+        return {k: v for k, v in vals.items() if v is not None}
+
+    # ---------------------------------------------------
+    # Helper → Bulk state transition on an array of ids
+    # ---------------------------------------------------
+    def _bulk_transition(self, action, allowed_states):
+        payload = json.loads(request.httprequest.data or '{}')
+        ids = payload.get('ids')
+
+        if not isinstance(ids, list) or not all(_is_id(i) for i in ids):
+            return request.make_json_response(
+                {'status': 'error', 'message': 'ids must be a list of integers'},
+                status=400
+            )
+
+        subscriptions = request.env['subscription.purchase.order'].sudo().browse(ids).exists()
+        found = set(subscriptions.ids)
+        errors = [{'id': i, 'message': 'Subscription not found'} for i in ids if i not in found]
+
+        wrong_state = subscriptions.filtered(lambda s: s.state not in allowed_states)
+        errors += [{'id': s.id, 'message': f"Invalid state '{s.state}'"} for s in wrong_state]
+        todo = subscriptions - wrong_state
+
+        if action == 'action_start':
+            no_lines = todo.filtered(lambda s: not s.line_ids)
+            errors += [{'id': s.id, 'message': 'Subscription has no product lines'} for s in no_lines]
+            todo -= no_lines
+
+        try:
+            # action_start / action_close write the whole recordset at once
+            if todo:
+                getattr(todo, action)()
+        except Exception as e:
+            _logger.exception("Error running %s on subscriptions", action)
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=500
+            )
+
+        return request.make_json_response({
+            'status': 'success',
+            'updated': todo.ids,
+            'errors': errors,
+        })
+
+    # ===================================================
+    # GET → All Subscriptions (PAGINATED)
+    # ===================================================
+    @http.route('/api/v2/subscriptions', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=2, burst=20, concurrency=2)
+    def get_subscriptions(self, limit=DEFAULT_LIMIT, offset=0, **kwargs):
+        try:
+            limit = min(max(int(limit), 1), MAX_LIMIT)
+            offset = max(int(offset), 0)
+        except (TypeError, ValueError):
+            return request.make_json_response(
+                {'status': 'error', 'message': 'limit and offset must be integers'},
+                status=400
+            )
+
+        Subscription = request.env['subscription.purchase.order'].sudo()
+        subscriptions = Subscription.search([], limit=limit, offset=offset)
+
+        data = serialize('subscription.purchase.order', subscriptions)
+
+        return json_response({
+            'status': 'success',
+            'count': len(data),
+            'total': Subscription.search_count([]),
+            'limit': limit,
+            'offset': offset,
+            'data': data
+        })
+
+    # ===================================================
+    # GET → Count Subscriptions (no data)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/count', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    def count_subscriptions(self, **kwargs):
+        count = request.env['subscription.purchase.order'].sudo().search_count([])
+        return request.make_json_response({'status': 'success', 'count': count})
+
+    # ===================================================
+    # GET → Single Subscription (ID or NAME)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/<string:identifier>', type='http',
+                auth='user', methods=['GET', 'HEAD'], csrf=False)
+    @instrument
+    def get_subscription(self, identifier, **kwargs):
+        sub = self._get_subscription(identifier)
+
+        # HEAD → existence check only, nothing is serialized
+        if request.httprequest.method == 'HEAD':
+            return request.make_response('', status=200 if sub else 404)
+
+        if not sub:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Subscription not found'},
+                status=404
+            )
+
+        data = serialize('subscription.purchase.order.detail', sub)[0]
+
+        return json_response({'status': 'success', 'data': data})
+
+    # ===================================================
+    # POST → Create Subscription
+    # ===================================================
+    @http.route('/api/v2/subscriptions', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    def create_subscription(self, **kwargs):
+        try:
+            payload = json.loads(request.httprequest.data or '{}')
+
+            required_fields = ['vendor_id', 'frequency', 'lines']
+            for field in required_fields:
+                if not payload.get(field):
+                    return request.make_json_response(
+                        {'status': 'error', 'message': f'{field} is required'},
+                        status=400
+                    )
+
+            vals = {
+                k: payload[k] for k in (
+                    'vendor_id', 'frequency', 'start_date', 'po_type',
+                    'days_to_notify', 'payment_method', 'payment_type',
+                ) if k in payload
+            }
+            vals['line_ids'] = [(0, 0, self._prepare_line_vals(line)) for line in payload['lines']]
+
+            sub = request.env['subscription.purchase.order'].sudo().create(vals)
+
+            return request.make_json_response(
+                {'status': 'success', 'id': sub.id, 'name': sub.name},
+                status=201
+            )
+
+        except Exception as e:
+            _logger.exception("Error creating subscription")
+            return request.make_json_response(
+                {'status': 'error', 'message': str(e)},
+                status=500
+            )
+
+    # ===================================================
+    # PUT → Full Update Subscription (LINES)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/<string:identifier>', type='http',
+                auth='user', methods=['PUT'], csrf=False)
+    @instrument
+    def put_subscription(self, identifier, **kwargs):
+        payload = json.loads(request.httprequest.data or '{}')
+        sub = self._get_subscription(identifier)
+
+        if not sub:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Subscription not found'},
+                status=404
+            )
+
+        if sub.state != 'draft':
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Only draft subscriptions can be updated'},
+                status=400
+            )
+
+        commands, error = prepare_line_commands(
+            sub, 'line_ids', payload,
+            update_vals=self._prepare_line_vals,
+            create_vals=lambda line, product: {
+                **self._prepare_line_vals(line),
+                'product_id': product.id,
+            },
+        )
+        if error:
+            return request.make_json_response(
+                {'status': 'error', 'message': error},
+                status=400
+            )
+
+        if commands:
+            sub.write({'line_ids': commands})
+
+        return request.make_json_response(
+            {'status': 'success', 'message': 'Subscription updated'}
+        )
+
+    # ===================================================
+    # PATCH → Partial Update Subscription (HEADER ONLY)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/<string:identifier>', type='http',
+                auth='user', methods=['PATCH'], csrf=False)
+    @instrument
+    def patch_subscription(self, identifier, **kwargs):
+        payload = json.loads(request.httprequest.data or '{}')
+        sub = self._get_subscription(identifier)
+
+        if not sub:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'Subscription not found'},
+                status=404
+            )
+
+        allowed_fields = {
+            'vendor_id',
+            'frequency',
+            'start_date',
+            'po_type',
+            'days_to_notify',
+            'payment_method',
+            'payment_type',
+        }
+
+        safe_payload = {k: v for k, v in payload.items() if k in allowed_fields}
+
+        if not safe_payload:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'No valid fields to update'},
+                status=400
+            )
+
+        sub.write(safe_payload)
+
+        return request.make_json_response(
+            {'status': 'success', 'message': 'Subscription partially updated'}
+        )
+
+    # ===================================================
+    # POST → Bulk Start (ARRAY OF IDS)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/start', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def start_subscriptions(self, **kwargs):
+        return self._bulk_transition('action_start', {'draft'})
+
+    # ===================================================
+    # POST → Bulk Close (ARRAY OF IDS)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/close', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.2, burst=5)
+    def close_subscriptions(self, **kwargs):
+        return self._bulk_transition('action_close', {'draft', 'running'})
+
+    # ===================================================
+    # GET → Spend Forecast (DRY RUN, NOTHING IS CREATED)
+    # ===================================================
+    @http.route('/api/v2/subscriptions/forecast', type='http', auth='user',
+                methods=['GET'], csrf=False)
+    @instrument
+    @rate_limit(rate=0.5, burst=5, concurrency=1)
+    def get_forecast(self, months=12, **kwargs):
+        try:
+            months = int(months)
+        except (TypeError, ValueError):
+            months = 0
+
+        if not 1 <= months <= 60:
+            return request.make_json_response(
+                {'status': 'error', 'message': 'months must be an integer between 1 and 60'},
+                status=400
+            )
+
+        data = request.env['subscription.purchase.order'].sudo()._get_purchase_forecast(months)
+
+        return request.make_json_response({
+            'status': 'success',
+            'months': months,
+            'count': len(data),
+            'data': data
+        })
+
+    # ===================================================
+    # OPTIONS → API Metadata
+    # ===================================================
+    @http.route('/api/v2/subscriptions', type='http',
+                auth='user', methods=['OPTIONS'], csrf=False)
+    @instrument
+    def options_subscriptions(self, **kwargs):
+        info = {
+            'collection': {
+                'endpoint': '/api/v2/subscriptions',
+                'methods': ['GET', 'POST', 'OPTIONS'],
+            },
+            'single_resource': {
+                'endpoint': '/api/v2/subscriptions/<id_or_name>',
+                'methods': ['GET', 'PUT', 'PATCH'],
+            },
+            'bulk_actions': {
+                'endpoints': ['/api/v2/subscriptions/start', '/api/v2/subscriptions/close'],
+                'methods': ['POST'],
+            },
+            'forecast': {
+                'endpoint': '/api/v2/subscriptions/forecast',
+                'methods': ['GET'],
+            },
+            'version': 'v2'
+        }
+
+        return request.make_json_response({'status': 'success', 'info': info})
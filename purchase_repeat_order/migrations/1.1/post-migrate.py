@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # Link POs generated before subscription_id existed (matched on origin)
+    cr.execute("""
+        UPDATE purchase_order po
+           SET subscription_id = sub.id
+          FROM subscription_purchase_order sub
+         WHERE po.origin = sub.name
+           AND po.subscription_id IS NULL
+    """)
+    _logger.info("Linked %s purchase orders to their subscription", cr.rowcount)
+
+    # po_count was computed before the backfill, refresh it in one pass
+    cr.execute("""
+        UPDATE subscription_purchase_order sub
+           SET po_count = (
+                SELECT COUNT(*)
+                  FROM purchase_order po
+                 WHERE po.subscription_id = sub.id
+           )
+    """)
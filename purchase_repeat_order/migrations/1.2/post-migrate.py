@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # The single product of each subscription becomes its first line. The old
+    # header columns are still present at this point of the upgrade.
+    cr.execute("""
+        INSERT INTO subscription_purchase_order_line (
+            subscription_id, sequence, product_id, product_description,
+            quantity, unit_price, unit, tax, sub_amount, amount,
+            company_id, currency_id,
+            create_uid, create_date, write_uid, write_date
+        )
+        SELECT sub.id, 10, sub.product_id, sub.product_description,
+               sub.quantity, sub.unit_price, sub.unit, sub.tax,
+               sub.sub_amount, sub.amount,
+               sub.company_id, sub.currency_id,
+               sub.create_uid, sub.create_date, sub.write_uid, sub.write_date
+          FROM subscription_purchase_order sub
+         WHERE sub.product_id IS NOT NULL
+           AND NOT EXISTS (
+                SELECT 1
+                  FROM subscription_purchase_order_line line
+                 WHERE line.subscription_id = sub.id
+           )
+    """)
+    _logger.info("Moved %s subscription products to lines", cr.rowcount)
+
+    cr.execute("""
+        UPDATE ir_model_data
+           SET noupdate = TRUE
+         WHERE module = 'purchase_repeat_order'
+           AND name IN ('email_template_subscription_po',
+                        'email_template_subscription_reminder')
+    """)
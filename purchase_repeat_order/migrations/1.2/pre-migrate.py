@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # Templates now iterate over line_ids; let the data file overwrite them
+    cr.execute("""
+        UPDATE ir_model_data
+           SET noupdate = FALSE
+         WHERE module = 'purchase_repeat_order'
+           AND name IN ('email_template_subscription_po',
+                        'email_template_subscription_reminder')
+    """)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # Seed the per-base counter with the highest RO number already in use
+    cr.execute(r"""
+        UPDATE purchase_order base
+           SET last_repeat_number = ro.max_number
+          FROM (
+                SELECT split_part(name, '-RO', 1) AS base_name,
+                       MAX(substring(name from '-RO(\d+)$')::integer) AS max_number
+                  FROM purchase_order
+                 WHERE name ~ '-RO\d+$'
+              GROUP BY 1
+          ) ro
+         WHERE base.name = ro.base_name
+    """)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # Last use of name parsing: link existing ROs to their base order
+    cr.execute(r"""
+        UPDATE purchase_order ro
+           SET repeat_origin_id = base.id
+          FROM purchase_order base
+         WHERE ro.name ~ '-RO\d+$'
+           AND base.name = split_part(ro.name, '-RO', 1)
+           AND ro.repeat_origin_id IS NULL
+    """)
+    _logger.info("Linked %s repeat orders to their base order", cr.rowcount)
+
+    cr.execute("""
+        UPDATE purchase_order po
+           SET repeat_count = family.total
+          FROM (
+                SELECT repeat_origin_id, COUNT(*) AS total
+                  FROM purchase_order
+                 WHERE repeat_origin_id IS NOT NULL
+              GROUP BY repeat_origin_id
+          ) family
+         WHERE po.id = family.repeat_origin_id
+    """)
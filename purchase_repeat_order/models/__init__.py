@@ -1,3 +1,3 @@
 from . import por
 from . import subscription_order
-
+from . import subscription_forecast
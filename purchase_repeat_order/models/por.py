@@ -1,65 +1,286 @@
-from odoo import models, fields, _
-from odoo.exceptions import ValidationError
+from collections import Counter, defaultdict
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError, ValidationError
 
 
 class PurchaseOrder(models.Model):
-    _inherit = 'purchase.order'
+    _inherit = ['purchase.order', 'api.sync.mixin']
 
     # Lock flag after Close
     is_closed_operation = fields.Boolean(default=False)
 
+    # Repeat lineage: every RO points to the original (base) order
+    repeat_origin_id = fields.Many2one(
+        'purchase.order',
+        string="Repeated From",
+        index=True,
+        copy=False,
+        readonly=True,
+        ondelete='set null',
+    )
+
+    repeat_ids = fields.One2many(
+        'purchase.order',
+        'repeat_origin_id',
+        string="Repeat Orders",
+        readonly=True,
+    )
+
+    repeat_count = fields.Integer(
+        string="Repeat Count",
+        compute="_compute_repeat_count",
+        store=True,
+    )
+
+    # Last RO number handed out for this base order (see _reserve_repeat_names)
+    last_repeat_number = fields.Integer(default=0, copy=False, readonly=True)
+
+    # Subscription that generated this PO (replaces matching on origin)
+    subscription_id = fields.Many2one(
+        'subscription.purchase.order',
+        string="Subscription",
+        index=True,
+        copy=False,
+        readonly=True,
+        ondelete='set null',
+    )
+
+    @api.depends('repeat_ids')
+    def _compute_repeat_count(self):
+        counts = {}
+        if self.ids:
+            groups = self._read_group(
+                [('repeat_origin_id', 'in', self.ids)],
+                groupby=['repeat_origin_id'],
+                aggregates=['__count'],
+            )
+            counts = {origin.id: count for origin, count in groups}
+        for order in self:
+            order.repeat_count = counts.get(order.id, 0)
+
+    # -------------------------
+    # FAMILY SMART BUTTON
+    # -------------------------
+    def _get_repeat_family_domain(self):
+        self.ensure_one()
+        base = self.repeat_origin_id or self
+        return ['|', ('id', '=', base.id), ('repeat_origin_id', '=', base.id)]
+
+    def action_view_repeat_family(self):
+        self.ensure_one()
+        return {
+            'name': _('Repeat Family'),
+            'type': 'ir.actions.act_window',
+            'res_model': 'purchase.order',
+            'view_mode': 'list,form',
+            'domain': self._get_repeat_family_domain(),
+            'context': {'create': False, 'from_repeated_orders_menu': True},
+        }
+
     # -------------------------
     # RO BUTTON
     # -------------------------
     def action_repeat_order(self):
         self.ensure_one()
 
-        if self.is_closed_operation:
-            raise ValidationError(_("This Purchase Order is closed."))
+        new_order = self._repeat_orders()
 
-        if not self.order_line:
-            raise ValidationError(_("Cannot repeat a Purchase Order without lines."))
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Repeated Purchase Order'),
+            'res_model': 'purchase.order',
+            'res_id': new_order.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
 
-        # 🔑 Get BASE PO name (before -RO)
-        base_name = self.name.split('-RO')[0]
+    # -------------------------
+    # REPEAT SELECTED (LIST ACTION)
+    # -------------------------
+    def action_repeat_selected(self):
+        new_orders = self._repeat_orders()
+
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Repeated Purchase Orders'),
+            'res_model': 'purchase.order',
+            'view_mode': 'list,form',
+            'domain': [('id', 'in', new_orders.ids)],
+            'context': {'from_repeated_orders_menu': True},
+            'target': 'current',
+        }
 
-        # Count existing ROs from base
-        ro_count = self.search_count([
-            ('name', 'like', f"{base_name}-RO%")
-        ])
+    def _get_repeat_errors(self):
+        """Reason each order cannot be repeated, keyed by order id."""
+        errors = {}
+        for order in self:
+            if order.is_closed_operation:
+                errors[order.id] = _("Purchase Order %s is closed.", order.name)
+            elif not order.order_line:
+                errors[order.id] = _("Cannot repeat Purchase Order %s without lines.", order.name)
+        return errors
 
-        new_name = f"{base_name}-RO{ro_count + 1}"
+    def _repeat_orders(self):
+        """Duplicate every order of ``self`` as a draft RO, once per order
+        even if ``self`` holds it several times.
 
-        new_order = self.copy({
-            'name': new_name,
+        Headers and lines are copied with a single batched ``create`` and the
+        RO names are reserved in one pass; lines are then planned from the
+        vendor lead time, as ``copy()`` does. Returns the new orders, in the
+        order their originals first appear in ``self``.
+        """
+        # Duplicate ids would get one reserved name for several copies
+        orders = self.browse(list(dict.fromkeys(self.ids)))
+
+        errors = orders._get_repeat_errors()
+        if errors:
+            raise ValidationError("\n".join(errors.values()))
+
+        names = orders._reserve_repeat_names()
+
+        vals_list = orders.copy_data({
             'state': 'draft',
             'is_closed_operation': False,
         })
+        bases = orders._get_repeat_bases()
+        for order, vals in zip(orders, vals_list):
+            vals['name'] = names[order.id]
+            vals['repeat_origin_id'] = bases[order.id].id
 
-        return {
-            'type': 'ir.actions.act_window',
-            'name': _('Repeated Purchase Order'),
-            'res_model': 'purchase.order',
-            'res_id': new_order.id,
-            'view_mode': 'form',
-            'target': 'current',
+        new_orders = self.create(vals_list)
+        new_orders._plan_repeat_lines()
+        return new_orders
+
+    def _plan_repeat_lines(self):
+        """Set ``date_planned`` of the lines of ``self`` from their seller,
+        like ``purchase.order.copy()``: one seller lookup per product, vendor,
+        quantity, unit and order date, one write per planned date."""
+        sellers = {}
+        lines_by_date = defaultdict(list)
+        for line in self.order_line.filtered('product_id'):
+            order_date = line.order_id.date_order and line.order_id.date_order.date()
+            key = (line.product_id, line.partner_id, line.product_qty, line.product_uom, order_date)
+            if key not in sellers:
+                sellers[key] = line.product_id._select_seller(
+                    partner_id=line.partner_id,
+                    quantity=line.product_qty,
+                    date=order_date,
+                    uom_id=line.product_uom,
+                )
+            lines_by_date[line._get_date_planned(sellers[key])].append(line.id)
+
+        Line = self.env['purchase.order.line']
+        for date_planned, line_ids in lines_by_date.items():
+            Line.browse(line_ids).write({'date_planned': date_planned})
+
+    def _get_repeat_bases(self):
+        """Original order of each repeat chain (itself when not a repeat)."""
+        return {order.id: order.repeat_origin_id or order for order in self}
+
+    def _reserve_repeat_names(self):
+        """Reserve the next ``<base>-RO<n>`` name of every order in ``self``.
+
+        The counter lives on the base order and is incremented with a single
+        UPDATE ... RETURNING: the row lock serialises concurrent repeats of
+        the same order, so numbering is constant-time and collision-free.
+        Returns ``{order_id: name}``.
+        """
+        bases = self._get_repeat_bases()
+        wanted = Counter(base.id for base in bases.values())
+        base_orders = self.browse(list(wanted))
+
+        base_orders.flush_recordset(['last_repeat_number'])
+        self.env.cr.execute("""
+            UPDATE purchase_order po
+               SET last_repeat_number = COALESCE(po.last_repeat_number, 0) + wanted.qty
+              FROM unnest(%s::integer[], %s::integer[]) AS wanted(id, qty)
+             WHERE po.id = wanted.id
+         RETURNING po.id, po.last_repeat_number
+        """, [list(wanted), list(wanted.values())])
+        # First free number per base, then hand them out in order
+        next_number = {
+            base_id: last - wanted[base_id] + 1
+            for base_id, last in self.env.cr.fetchall()
         }
+        base_orders.invalidate_recordset(['last_repeat_number'])
+
+        # One name per distinct order, as counted in ``wanted``
+        names = {}
+        for order_id, base in bases.items():
+            names[order_id] = f"{base.name}-RO{next_number[base.id]}"
+            next_number[base.id] += 1
+        return names
 
     # -------------------------
     # CLOSE BUTTON
     # -------------------------
     def action_close_operation(self):
-        self.ensure_one()
+        errors = self._close_operations()
+        if errors:
+            raise UserError("\n".join(errors.values()))
+
+        return {'type': 'ir.actions.act_window_close'}
+
+    # -------------------------
+    # CLOSE SELECTED (LIST ACTION)
+    # -------------------------
+    def action_close_selected(self):
+        errors = self._close_operations()
+        closed = len(self) - len(errors)
+
+        message = _("%s Purchase Order(s) closed.", closed)
+        if errors:
+            message += "\n" + "\n".join(errors.values())
+
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Close Purchase Orders'),
+                'message': message,
+                'type': 'warning' if errors else 'success',
+                'sticky': bool(errors),
+                'next': {'type': 'ir.actions.act_window_close'},
+            },
+        }
+
+    def _close_operations(self):
+        """Confirm and lock every order of ``self``.
+
+        Draft RFQs are confirmed together, then all orders are marked done
+        with a single write. An order that fails to confirm is left out and
+        reported. Returns ``{order_id: error message}``.
+        """
+        errors = {}
+        for order in self:
+            if order.is_closed_operation:
+                errors[order.id] = _("Purchase Order %s is already closed.", order.name)
+            elif order.state == 'cancel':
+                errors[order.id] = _("Purchase Order %s is cancelled.", order.name)
+
+        todo = self.filtered(lambda o: o.id not in errors)
 
         # Confirm if needed
-        if self.state == 'draft':
-            self.button_confirm()
+        drafts = todo.filtered(lambda o: o.state in ('draft', 'sent'))
+        if drafts:
+            try:
+                with self.env.cr.savepoint():
+                    drafts.button_confirm()
+            except Exception:
+                # Retry one by one to find which orders block the batch
+                for order in drafts:
+                    try:
+                        with self.env.cr.savepoint():
+                            order.button_confirm()
+                    except Exception as e:
+                        errors[order.id] = _("Purchase Order %(name)s: %(error)s",
+                                             name=order.name, error=e)
 
         # Mark completed & lock
-        self.write({
+        todo.filtered(lambda o: o.id not in errors).write({
             'state': 'done',
             'is_closed_operation': True,
         })
 
-        return {'type': 'ir.actions.act_window_close'}
-
+        return errors
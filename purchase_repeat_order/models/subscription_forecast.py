@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, tools
+
+
+class SubscriptionPurchaseForecast(models.Model):
+    _name = 'subscription.purchase.forecast'
+    _description = 'Subscription Purchase Forecast'
+    _auto = False
+    _rec_name = 'date'
+    _order = 'date'
+
+    # One row per subscription line and scheduled PO over the next 12 months.
+    # Same schedule rule as SubscriptionPurchaseOrder._get_purchase_forecast.
+
+    date = fields.Datetime(string="Planned PO Date", readonly=True)
+    subscription_id = fields.Many2one('subscription.purchase.order', string="Subscription", readonly=True)
+    vendor_id = fields.Many2one('res.partner', string="Vendor", readonly=True)
+    product_id = fields.Many2one('product.product', string="Product", readonly=True)
+    frequency = fields.Selection([
+        ('daily', 'Daily'),
+        ('weekly', 'Weekly'),
+        ('monthly', 'Monthly'),
+        ('quarterly', 'Quarterly'),
+        ('half_yearly', 'Half Yearly'),
+        ('yearly', 'Yearly'),
+    ], readonly=True)
+    company_id = fields.Many2one('res.company', string="Company", readonly=True)
+    currency_id = fields.Many2one('res.currency', string="Currency", readonly=True)
+    quantity = fields.Float(readonly=True)
+    sub_amount = fields.Monetary(string="Subtotal", readonly=True)
+    amount = fields.Monetary(string="Total Amount", readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute("""
+            CREATE OR REPLACE VIEW %s AS (
+                WITH steps AS (
+                    SELECT sub.id,
+                           GREATEST(sub.next_invoice_date, NOW() AT TIME ZONE 'UTC') AS start,
+                           CASE sub.frequency
+                               WHEN 'daily' THEN INTERVAL '1 day'
+                               WHEN 'weekly' THEN INTERVAL '7 days'
+                               WHEN 'monthly' THEN INTERVAL '1 month'
+                               WHEN 'quarterly' THEN INTERVAL '3 months'
+                               WHEN 'half_yearly' THEN INTERVAL '6 months'
+                               WHEN 'yearly' THEN INTERVAL '1 year'
+                           END AS every,
+                           CASE sub.frequency
+                               WHEN 'daily' THEN 366
+                               WHEN 'weekly' THEN 53
+                               WHEN 'monthly' THEN 12
+                               WHEN 'quarterly' THEN 4
+                               WHEN 'half_yearly' THEN 2
+                               ELSE 1
+                           END AS max_steps
+                      FROM subscription_purchase_order sub
+                     WHERE sub.state = 'running'
+                       AND sub.next_invoice_date IS NOT NULL
+                       AND sub.frequency IS NOT NULL
+                ),
+                schedule AS (
+                    SELECT steps.id AS subscription_id,
+                           steps.start + occ.k * steps.every AS date
+                      FROM steps
+                     CROSS JOIN LATERAL generate_series(0, steps.max_steps) AS occ(k)
+                     WHERE steps.start + occ.k * steps.every
+                           < (NOW() AT TIME ZONE 'UTC') + INTERVAL '12 months'
+                )
+                SELECT ROW_NUMBER() OVER (ORDER BY schedule.date, line.id) AS id,
+                       schedule.date,
+                       sub.id AS subscription_id,
+                       sub.vendor_id,
+                       line.product_id,
+                       sub.frequency,
+                       sub.company_id,
+                       sub.currency_id,
+                       line.quantity,
+                       line.sub_amount,
+                       line.amount
+                  FROM schedule
+                  JOIN subscription_purchase_order sub ON sub.id = schedule.subscription_id
+                  JOIN subscription_purchase_order_line line ON line.subscription_id = sub.id
+            )
+        """ % self._table)
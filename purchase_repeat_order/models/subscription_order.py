@@ -1,17 +1,28 @@
 # -*- coding: utf-8 -*-
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError, UserError
+from collections import Counter, defaultdict
 from datetime import timedelta
 from dateutil.relativedelta import relativedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Step between two POs of a subscription, per frequency
+FREQUENCY_DELTAS = {
+    'daily': relativedelta(days=1),
+    'weekly': relativedelta(days=7),
+    'monthly': relativedelta(months=1),
+    'quarterly': relativedelta(months=3),
+    'half_yearly': relativedelta(months=6),
+    'yearly': relativedelta(years=1),
+}
+
 
 class SubscriptionPurchaseOrder(models.Model):
     _name = 'subscription.purchase.order'
     _description = 'Subscription Purchase Order'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'api.sync.mixin']
     _rec_name = 'name'
     _order = 'id desc'
 
@@ -34,15 +45,6 @@ class SubscriptionPurchaseOrder(models.Model):
         tracking=True
     )
 
-    product_id = fields.Many2one(
-        'product.product',
-        string="Product",
-        required=True,
-        tracking=True
-    )
-
-    product_description = fields.Text(string="Description")
-
     po_type = fields.Selection([
         ('regular', 'Regular'),
         ('contract', 'Contract')
@@ -50,9 +52,12 @@ class SubscriptionPurchaseOrder(models.Model):
 
     days_to_notify = fields.Integer(string="Days to Notify", default=1)
 
-    quantity = fields.Float(default=1.0, required=True)
-    unit_price = fields.Float(string="Unit Price", required=True, default=1.0)
-    unit = fields.Many2one('uom.uom', string="Unit of Measure")
+    line_ids = fields.One2many(
+        'subscription.purchase.order.line',
+        'subscription_id',
+        string="Products",
+        copy=True
+    )
 
     # =========================================================
     # SUBSCRIPTION LOGIC
@@ -90,7 +95,6 @@ class SubscriptionPurchaseOrder(models.Model):
     # =========================================================
 
     sub_amount = fields.Float(string="Subtotal", compute="_compute_amount", store=True)
-    tax = fields.Many2one('account.tax', string="Tax")
     amount = fields.Float(string="Total Amount", compute="_compute_amount", store=True)
 
     payment_method = fields.Selection([
@@ -114,7 +118,18 @@ class SubscriptionPurchaseOrder(models.Model):
         tracking=True
     )
 
-    po_count = fields.Integer(string="PO Count", compute="_compute_po_count")
+    purchase_order_ids = fields.One2many(
+        'purchase.order',
+        'subscription_id',
+        string="Purchase Orders",
+        readonly=True
+    )
+
+    po_count = fields.Integer(
+        string="PO Count",
+        compute="_compute_po_count",
+        store=True
+    )
 
     # =========================================================
     # STATE
@@ -156,16 +171,13 @@ class SubscriptionPurchaseOrder(models.Model):
     # COMPUTE METHODS
     # =========================================================
 
-    @api.depends('quantity', 'unit_price', 'tax')
+    @api.depends('line_ids.sub_amount', 'line_ids.amount')
     def _compute_amount(self):
+        # Line amounts are computed (and stored) in batch on the line model,
+        # the header only aggregates them.
         for rec in self:
-            subtotal = rec.quantity * rec.unit_price
-            rec.sub_amount = subtotal
-            if rec.tax:
-                taxes = rec.tax.compute_all(rec.unit_price, quantity=rec.quantity)
-                rec.amount = taxes['total_included']
-            else:
-                rec.amount = subtotal
+            rec.sub_amount = sum(rec.line_ids.mapped('sub_amount'))
+            rec.amount = sum(rec.line_ids.mapped('amount'))
 
     @api.depends('last_invoice_date', 'frequency')
     def _compute_next_invoice_date(self):
@@ -187,27 +199,29 @@ class SubscriptionPurchaseOrder(models.Model):
             elif rec.frequency == 'yearly':
                 rec.next_invoice_date = rec.last_invoice_date + relativedelta(years=1)
 
+    @api.depends('purchase_order_ids')
     def _compute_po_count(self):
+        # One grouped query for the whole batch instead of a count per record
+        counts = {}
+        if self.ids:
+            groups = self.env['purchase.order']._read_group(
+                [('subscription_id', 'in', self.ids)],
+                groupby=['subscription_id'],
+                aggregates=['__count'],
+            )
+            counts = {subscription.id: count for subscription, count in groups}
         for rec in self:
-            rec.po_count = self.env['purchase.order'].search_count([
-                ('origin', '=', rec.name)
-            ])
+            rec.po_count = counts.get(rec.id, 0)
 
     # =========================================================
     # VALIDATIONS
     # =========================================================
 
-    @api.constrains('quantity')
-    def _check_quantity(self):
-        for rec in self:
-            if rec.quantity <= 0:
-                raise ValidationError(_("Quantity must be greater than 0."))
-
-    @api.constrains('unit_price')
-    def _check_unit_price(self):
+    @api.constrains('state', 'line_ids')
+    def _check_lines(self):
         for rec in self:
-            if rec.unit_price <= 0:
-                raise ValidationError(_("Unit price must be greater than 0."))
+            if rec.state == 'running' and not rec.line_ids:
+                raise ValidationError(_("A running subscription needs at least one product line."))
 
     # =========================================================
     # CRON AUTOMATION
@@ -243,18 +257,20 @@ class SubscriptionPurchaseOrder(models.Model):
     def _create_subscription_po(self):
         self.ensure_one()
 
+        if not self.line_ids:
+            raise UserError(_("Subscription %s has no product lines.", self.name))
+
+        date_planned = fields.Date.today()
+
+        # All order lines go through the single purchase.order create
         po_vals = {
             'partner_id': self.vendor_id.id,
             'origin': self.name,
-            'order_line': [(0, 0, {
-                'product_id': self.product_id.id,
-                'product_qty': self.quantity,
-                'price_unit': self.unit_price,
-                'product_uom': (self.unit or self.product_id.uom_id).id,
-                'taxes_id': [(6, 0, [self.tax.id])] if self.tax else [],
-                'date_planned': fields.Date.today(),
-                'name': self.product_description or self.product_id.display_name,
-            })]
+            'subscription_id': self.id,
+            'order_line': [
+                (0, 0, line._prepare_purchase_line_vals(date_planned))
+                for line in self.line_ids
+            ]
         }
 
         po = self.env['purchase.order'].create(po_vals)
@@ -287,6 +303,66 @@ class SubscriptionPurchaseOrder(models.Model):
                 }
             )
 
+    # =========================================================
+    # FORECAST (DRY RUN)
+    # =========================================================
+
+    @api.model
+    def _get_purchase_forecast(self, months=12):
+        """Spend the running subscriptions will generate over ``months``.
+
+        Nothing is written: each schedule is expanded in memory once per
+        subscription and applied to all of its lines. Overdue subscriptions
+        are raised by the next cron run, so their schedule starts now.
+        Returns rows aggregated by month, vendor, product and currency.
+        """
+        now = fields.Datetime.now()
+        horizon = now + relativedelta(months=months)
+
+        subscriptions = self.search([
+            ('state', '=', 'running'),
+            ('next_invoice_date', '!=', False),
+        ])
+
+        # subscription id -> Counter(month -> number of POs)
+        schedule = {}
+        for sub in subscriptions:
+            step = FREQUENCY_DELTAS.get(sub.frequency)
+            if not step:
+                continue
+            start = max(sub.next_invoice_date, now)
+            occurrences = Counter()
+            k = 0
+            date = start
+            while date < horizon:
+                occurrences[date.strftime('%Y-%m')] += 1
+                k += 1
+                date = start + step * k
+            schedule[sub.id] = occurrences
+
+        totals = defaultdict(lambda: {'quantity': 0.0, 'sub_amount': 0.0, 'amount': 0.0})
+        for line in subscriptions.line_ids:
+            sub = line.subscription_id
+            for month, count in schedule.get(sub.id, {}).items():
+                bucket = totals[(month, sub.vendor_id, line.product_id, sub.currency_id)]
+                bucket['quantity'] += line.quantity * count
+                bucket['sub_amount'] += line.sub_amount * count
+                bucket['amount'] += line.amount * count
+
+        return [{
+            'month': month,
+            'vendor_id': vendor.id,
+            'vendor': vendor.name,
+            'product_id': product.id,
+            'product': product.display_name,
+            'currency': currency.name,
+            'quantity': values['quantity'],
+            'sub_amount': currency.round(values['sub_amount']),
+            'amount': currency.round(values['amount']),
+        } for (month, vendor, product, currency), values in sorted(
+            totals.items(), key=lambda item: (item[0][0], item[0][1].id, item[0][2].id)
+        )]
+
     # =========================================================
     # BUTTON ACTIONS
     # =========================================================
@@ -321,12 +397,133 @@ class SubscriptionPurchaseOrder(models.Model):
             'type': 'ir.actions.act_window',
             'res_model': 'purchase.order',
             'view_mode': 'list,form',
-            'domain': [('origin', '=', self.name)],
-            'context': {'create': False},
+            'domain': [('subscription_id', '=', self.id)],
+            'context': {'create': False, 'default_subscription_id': self.id},
         }
 
 
 
+class SubscriptionPurchaseOrderLine(models.Model):
+    _name = 'subscription.purchase.order.line'
+    _description = 'Subscription Purchase Order Line'
+    _order = 'subscription_id, sequence, id'
+
+    subscription_id = fields.Many2one(
+        'subscription.purchase.order',
+        string="Subscription",
+        required=True,
+        index=True,
+        ondelete='cascade'
+    )
+
+    sequence = fields.Integer(default=10)
+
+    product_id = fields.Many2one(
+        'product.product',
+        string="Product",
+        required=True
+    )
+
+    product_description = fields.Text(string="Description")
+
+    quantity = fields.Float(default=1.0, required=True)
+    unit_price = fields.Float(string="Unit Price", required=True, default=1.0)
+    unit = fields.Many2one('uom.uom', string="Unit of Measure")
+    tax = fields.Many2one('account.tax', string="Tax")
+
+    sub_amount = fields.Float(string="Subtotal", compute="_compute_amount", store=True)
+    amount = fields.Float(string="Total Amount", compute="_compute_amount", store=True)
+
+    company_id = fields.Many2one(
+        related='subscription_id.company_id',
+        store=True
+    )
+
+    currency_id = fields.Many2one(
+        related='subscription_id.currency_id',
+        store=True
+    )
+
+    # =========================================================
+    # COMPUTE METHODS
+    # =========================================================
+
+    @api.depends('quantity', 'unit_price', 'tax', 'currency_id')
+    def _compute_amount(self):
+        for line in self:
+            line.sub_amount = line.quantity * line.unit_price
+
+        untaxed = self.filtered(lambda l: not l.tax)
+        for line in untaxed:
+            line.amount = line.sub_amount
+
+        taxed = self - untaxed
+        for (tax, currency), lines in taxed.grouped(lambda l: (l.tax, l.currency_id)).items():
+            if self._is_simple_percent_tax(tax):
+                # Plain percentage on the untaxed amount, rounded per line:
+                # the same result as compute_all, without the tax engine
+                currency = currency or tax.company_id.currency_id
+                for line in lines:
+                    base = currency.round(line.unit_price * line.quantity)
+                    line.amount = base + currency.round(base * tax.amount / 100)
+                continue
+
+            # Other taxes: run the tax engine once per distinct price/qty
+            totals = {}
+            for line in lines:
+                key = (line.unit_price, line.quantity)
+                if key not in totals:
+                    totals[key] = tax.compute_all(
+                        line.unit_price,
+                        currency=currency or None,
+                        quantity=line.quantity,
+                    )['total_included']
+                line.amount = totals[key]
+
+    @api.model
+    def _is_simple_percent_tax(self, tax):
+        """Whether ``tax`` totals can be computed as ``base + round(base *
+        amount%)`` instead of with ``compute_all``."""
+        return (
+            tax.amount_type == 'percent'
+            and not tax.price_include
+            and not tax.include_base_amount
+            and tax.company_id.tax_calculation_rounding_method == 'round_per_line'
+        )
+
+    # =========================================================
+    # VALIDATIONS
+    # =========================================================
+
+    @api.constrains('quantity')
+    def _check_quantity(self):
+        for line in self:
+            if line.quantity <= 0:
+                raise ValidationError(_("Quantity must be greater than 0."))
+
+    @api.constrains('unit_price')
+    def _check_unit_price(self):
+        for line in self:
+            if line.unit_price <= 0:
+                raise ValidationError(_("Unit price must be greater than 0."))
+
+    # =========================================================
+    # INTERNAL HELPERS
+    # =========================================================
+
+    def _prepare_purchase_line_vals(self, date_planned):
+        self.ensure_one()
+        return {
+            'product_id': self.product_id.id,
+            'product_qty': self.quantity,
+            'price_unit': self.unit_price,
+            'product_uom': (self.unit or self.product_id.uom_id).id,
+            'taxes_id': [(6, 0, [self.tax.id])] if self.tax else [],
+            'date_planned': date_planned,
+            'name': self.product_description or self.product_id.display_name,
+        }
+
+
 
 
 
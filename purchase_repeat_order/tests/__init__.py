@@ -0,0 +1,4 @@
+from . import test_api
+from . import test_migrations
+from . import test_repeat_order
+from . import test_subscription_amount
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import tagged
+
+from odoo.addons.api_v2_common.tests.common import ApiHttpCase
+
+
+@tagged('post_install', '-at_install')
+class TestRepeatRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'API Repeat Vendor'})
+        cls.product = cls.env['product.product'].create({'name': 'API Repeat Product'})
+        cls.order = cls.env['purchase.order'].create({
+            'partner_id': cls.vendor.id,
+            'order_line': [(0, 0, {'product_id': cls.product.id, 'price_unit': 10})],
+        })
+
+    def test_repeat(self):
+        response = self.api('POST', '/api/v2/purchases/repeat', {'ids': [self.order.id, self.order.id, 0]})
+        self.assertEqual(response.status_code, 201)
+        result = response.json()
+        # A repeated id is only repeated once
+        self.assertEqual([o['name'] for o in result['data']], [f"{self.order.name}-RO1"])
+        self.assertEqual(result['errors'], [{'id': 0, 'message': 'Purchase Order not found'}])
+
+        self.assertEqual(self.api('POST', '/api/v2/purchases/repeat', {'ids': 'all'}).status_code, 400)
+        self.assertEqual(self.api('POST', '/api/v2/purchases/repeat', {'ids': [True]}).status_code, 400)
+
+    def test_close(self):
+        result = self.api('POST', '/api/v2/purchases/close', {'ids': [self.order.id]}).json()
+        self.assertEqual(result['closed'], [self.order.id])
+        self.assertTrue(self.order.is_closed_operation)
+
+        # Closed orders are neither closed again nor repeated
+        result = self.api('POST', '/api/v2/purchases/close', {'ids': [self.order.id]}).json()
+        self.assertEqual([e['id'] for e in result['errors']], [self.order.id])
+        result = self.api('POST', '/api/v2/purchases/repeat', {'ids': [self.order.id]}).json()
+        self.assertEqual(result['count'], 0)
+
+    def test_family(self):
+        repeat = self.order._repeat_orders()
+
+        family = self.api('GET', f'/api/v2/purchases/name:{repeat.name}/family').json()['data']
+        self.assertEqual(family['base_id'], self.order.id)
+        self.assertEqual([o['is_repeat'] for o in family['orders']], [False, True])
+        self.assertEqual(family['totals'][0]['count'], 2)
+
+        self.assertEqual(self.api('GET', '/api/v2/purchases/name:NO-SUCH-PO/family').status_code, 404)
+
+
+@tagged('post_install', '-at_install')
+class TestSubscriptionRoutes(ApiHttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'API Subscription Vendor'})
+        cls.product = cls.env['product.product'].create({'name': 'API Subscription Product'})
+        cls.subscription = cls._create_subscription()
+
+    @classmethod
+    def _create_subscription(cls):
+        return cls.env['subscription.purchase.order'].create({
+            'vendor_id': cls.vendor.id,
+            'frequency': 'monthly',
+            'line_ids': [(0, 0, {'product_id': cls.product.id, 'quantity': 2, 'unit_price': 5})],
+        })
+
+    def test_forecast(self):
+        self.subscription.action_start()
+
+        response = self.api('GET', '/api/v2/subscriptions/forecast', params={'months': 3}).json()
+        rows = [row for row in response['data'] if row['vendor_id'] == self.vendor.id]
+        # One PO a month, nothing created by the dry run
+        self.assertTrue(rows)
+        self.assertEqual({row['quantity'] for row in rows}, {2})
+        self.assertEqual(self.subscription.po_count, 0)
+
+        self.assertEqual(self.api('GET', '/api/v2/subscriptions/forecast', params={'months': 0}).status_code, 400)
+
+    def test_read(self):
+        response = self.api('GET', '/api/v2/subscriptions', params={'limit': 1}).json()
+        self.assertEqual(response['count'], 1)
+        self.assertEqual(response['total'], self.env['subscription.purchase.order'].search_count([]))
+
+        data = self.api('GET', f'/api/v2/subscriptions/name:{self.subscription.name}').json()['data']
+        self.assertEqual(data['id'], self.subscription.id)
+        self.assertEqual(data['lines'][0]['total'], 10)
+
+    def test_count_and_head(self):
+        response = self.api('GET', '/api/v2/subscriptions/count')
+        self.assertEqual(response.json()['count'], self.env['subscription.purchase.order'].search_count([]))
+
+        self.assertEqual(self.api('HEAD', f'/api/v2/subscriptions/{self.subscription.id}').status_code, 200)
+        self.assertEqual(self.api('HEAD', '/api/v2/subscriptions/name:NO-SUCH-SUB').status_code, 404)
+
+    def test_create(self):
+        response = self.api('POST', '/api/v2/subscriptions', {
+            'vendor_id': self.vendor.id,
+            'frequency': 'weekly',
+            'lines': [{'product_id': self.product.id, 'quantity': 1, 'price_unit': 3}],
+        })
+        self.assertEqual(response.status_code, 201)
+        subscription = self.env['subscription.purchase.order'].browse(response.json()['id'])
+        self.assertEqual(subscription.line_ids.unit_price, 3)
+
+        response = self.api('POST', '/api/v2/subscriptions', {'vendor_id': self.vendor.id})
+        self.assertEqual(response.status_code, 400)
+
+    def test_put_lines(self):
+        line = self.subscription.line_ids
+        response = self.api('PUT', f'/api/v2/subscriptions/{self.subscription.id}', {
+            'update_lines': [{'line_id': line.id, 'quantity': 4}],
+            'new_lines': [{'product_id': self.product.id, 'price_unit': 1}],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(line.quantity, 4)
+        self.assertEqual(len(self.subscription.line_ids), 2)
+
+    def test_put_rejects_foreign_lines(self):
+        foreign = self._create_subscription().line_ids
+        path = f'/api/v2/subscriptions/{self.subscription.id}'
+
+        for payload in (
+            {'update_lines': [{'line_id': foreign.id, 'quantity': 99}]},
+            {'delete_lines': [foreign.id]},
+            {'delete_lines': [True]},
+        ):
+            self.assertEqual(self.api('PUT', path, payload).status_code, 400)
+
+        self.assertEqual(foreign.quantity, 2)
+        self.assertTrue(foreign.exists())
+
+    def test_patch(self):
+        path = f'/api/v2/subscriptions/{self.subscription.id}'
+        self.assertEqual(self.api('PATCH', path, {'frequency': 'yearly'}).status_code, 200)
+        self.assertEqual(self.subscription.frequency, 'yearly')
+        self.assertEqual(self.api('PATCH', path, {'state': 'closed'}).status_code, 400)
+
+    def test_start_and_close(self):
+        empty = self.env['subscription.purchase.order'].create({
+            'vendor_id': self.vendor.id,
+            'frequency': 'monthly',
+        })
+
+        result = self.api('POST', '/api/v2/subscriptions/start', {
+            'ids': [self.subscription.id, empty.id, 0],
+        }).json()
+        self.assertEqual(result['updated'], [self.subscription.id])
+        self.assertEqual(sorted(e['id'] for e in result['errors']), [0, empty.id])
+        self.assertEqual(self.subscription.state, 'running')
+
+        response = self.api('POST', '/api/v2/subscriptions/close', {'ids': [True]})
+        self.assertEqual(response.status_code, 400)
+
+        result = self.api('POST', '/api/v2/subscriptions/close', {'ids': [self.subscription.id]}).json()
+        self.assertEqual(result['updated'], [self.subscription.id])
+        self.assertEqual(self.subscription.state, 'closed')
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import importlib.util
+
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import file_path
+
+
+def run_migration(cr, version, script, installed_version='1.0'):
+    """Run ``migrations/<version>/<script>.py`` as an upgrade from
+    ``installed_version`` (``None`` on a fresh install)."""
+    path = file_path(f'purchase_repeat_order/migrations/{version}/{script}.py')
+    spec = importlib.util.spec_from_file_location(f'purchase_repeat_order_{script}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.migrate(cr, installed_version)
+
+
+@tagged('post_install', '-at_install')
+class TestMigrations(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'Migration Vendor'})
+        cls.product = cls.env['product.product'].create({'name': 'Migration Product'})
+
+    def _create_order(self, **vals):
+        return self.env['purchase.order'].create({
+            'partner_id': self.vendor.id,
+            'order_line': [(0, 0, {'product_id': self.product.id})],
+            **vals,
+        })
+
+    def _create_subscription(self, **vals):
+        return self.env['subscription.purchase.order'].create({
+            'vendor_id': self.vendor.id,
+            'frequency': 'monthly',
+            **vals,
+        })
+
+    def _migrate(self, version, script='post-migrate', installed_version='1.0'):
+        self.env.flush_all()
+        run_migration(self.env.cr, version, script, installed_version)
+        self.env.invalidate_all()
+
+    def test_1_1_links_subscription_orders(self):
+        subscription = self._create_subscription()
+        order = self._create_order(origin=subscription.name)
+        other = self._create_order(origin='Something else')
+
+        self._migrate('1.1')
+
+        self.assertEqual(order.subscription_id, subscription)
+        self.assertFalse(other.subscription_id)
+        self.assertEqual(subscription.po_count, 1)
+
+    def test_1_2_moves_header_product_to_lines(self):
+        # The single-product header columns are gone from the model
+        self.env.cr.execute("""
+            ALTER TABLE subscription_purchase_order
+                ADD COLUMN IF NOT EXISTS product_id integer,
+                ADD COLUMN IF NOT EXISTS product_description text,
+                ADD COLUMN IF NOT EXISTS quantity numeric,
+                ADD COLUMN IF NOT EXISTS unit_price numeric,
+                ADD COLUMN IF NOT EXISTS unit integer,
+                ADD COLUMN IF NOT EXISTS tax integer
+        """)
+        subscription = self._create_subscription()
+        with_lines = self._create_subscription(line_ids=[(0, 0, {'product_id': self.product.id})])
+        self.env.flush_all()
+        self.env.cr.execute("""
+            UPDATE subscription_purchase_order
+               SET product_id = %s, product_description = 'Legacy', quantity = 3, unit_price = 7
+             WHERE id IN %s
+        """, [self.product.id, (subscription.id, with_lines.id)])
+
+        self._migrate('1.2', 'pre-migrate')
+        templates = self.env['ir.model.data'].search([
+            ('module', '=', 'purchase_repeat_order'),
+            ('name', 'in', ('email_template_subscription_po', 'email_template_subscription_reminder')),
+        ])
+        self.assertFalse(any(templates.mapped('noupdate')))
+
+        self._migrate('1.2')
+
+        line = subscription.line_ids
+        self.assertEqual(len(line), 1)
+        self.assertEqual(
+            (line.product_id, line.product_description, line.quantity, line.unit_price),
+            (self.product, 'Legacy', 3, 7),
+        )
+        # Subscriptions that already have lines are left alone
+        self.assertEqual(len(with_lines.line_ids), 1)
+        self.assertTrue(all(templates.mapped('noupdate')))
+
+    def test_1_3_seeds_repeat_counter(self):
+        base = self._create_order(name='MIG-BASE')
+        self._create_order(name='MIG-BASE-RO3')
+        self._create_order(name='MIG-BASE-RO12')
+
+        self._migrate('1.3')
+
+        self.assertEqual(base.last_repeat_number, 12)
+        self.assertEqual(base._reserve_repeat_names(), {base.id: 'MIG-BASE-RO13'})
+
+    def test_1_4_links_repeat_orders(self):
+        base = self._create_order(name='MIG-ORIGIN')
+        repeats = self._create_order(name='MIG-ORIGIN-RO1') | self._create_order(name='MIG-ORIGIN-RO2')
+        unrelated = self._create_order(name='MIG-OTHER')
+
+        self._migrate('1.4')
+
+        self.assertEqual(repeats.repeat_origin_id, base)
+        self.assertFalse(unrelated.repeat_origin_id)
+        self.assertEqual(base.repeat_count, 2)
+
+    def test_fresh_install_is_skipped(self):
+        subscription = self._create_subscription()
+        order = self._create_order(origin=subscription.name)
+
+        self._migrate('1.1', installed_version=None)
+
+        self.assertFalse(order.subscription_id)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestRepeatOrder(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'Repeat Vendor'})
+        cls.product = cls.env['product.product'].create({
+            'name': 'Repeat Product',
+            'seller_ids': [(0, 0, {'partner_id': cls.vendor.id, 'delay': 7, 'price': 10})],
+        })
+        cls.other_product = cls.env['product.product'].create({'name': 'No Seller Product'})
+
+    def _create_order(self):
+        return self.env['purchase.order'].create({
+            'partner_id': self.vendor.id,
+            'order_line': [
+                (0, 0, {'product_id': self.product.id, 'product_qty': 2}),
+                (0, 0, {'product_id': self.other_product.id, 'product_qty': 1}),
+            ],
+        })
+
+    def test_repeat_plans_from_vendor_lead_time(self):
+        orders = self._create_order() | self._create_order()
+
+        repeats = orders._repeat_orders()
+
+        self.assertEqual(len(repeats), 2)
+        for repeat, order in zip(repeats, orders):
+            self.assertEqual(repeat.repeat_origin_id, order)
+            self.assertEqual(repeat.state, 'draft')
+            line, other_line = repeat.order_line.sorted(lambda l: l.product_id != self.product)
+            self.assertEqual(line.date_planned, repeat.date_order + timedelta(days=7))
+            self.assertEqual(other_line.date_planned, repeat.date_order)
+
+    def test_repeat_names(self):
+        order = self._create_order()
+
+        first = order._repeat_orders()
+        second = (order | first)._repeat_orders()
+
+        self.assertEqual(first.name, f"{order.name}-RO1")
+        self.assertEqual(second.mapped('name'), [f"{order.name}-RO2", f"{order.name}-RO3"])
+
+    def test_repeat_duplicate_ids(self):
+        order = self._create_order()
+
+        repeats = order.browse([order.id, order.id])._repeat_orders()
+        again = order._repeat_orders()
+
+        self.assertEqual(repeats.mapped('name'), [f"{order.name}-RO1"])
+        self.assertEqual(again.name, f"{order.name}-RO2")
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import logging
+import random
+import time
+from unittest.mock import patch
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.tests import tagged
+
+_logger = logging.getLogger(__name__)
+
+
+class SubscriptionAmountCommon(AccountTestInvoicingCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vendor = cls.env['res.partner'].create({'name': 'Subscription Vendor'})
+        cls.product = cls.env['product.product'].create({'name': 'Subscription Product'})
+
+    def _create_subscription(self, tax, prices):
+        return self.env['subscription.purchase.order'].create({
+            'vendor_id': self.vendor.id,
+            'frequency': 'monthly',
+            'line_ids': [(0, 0, {
+                'product_id': self.product.id,
+                'quantity': quantity,
+                'unit_price': price,
+                'tax': tax.id,
+            }) for price, quantity in prices],
+        })
+
+    def _assert_compute_all(self, lines):
+        for line in lines:
+            expected = line.tax.compute_all(
+                line.unit_price, currency=line.currency_id or None, quantity=line.quantity,
+            )['total_included']
+            self.assertAlmostEqual(line.amount, expected, places=6)
+
+
+@tagged('post_install', '-at_install')
+class TestSubscriptionAmount(SubscriptionAmountCommon):
+
+    def test_simple_percent_matches_compute_all(self):
+        rng = random.Random(42)
+        prices = [(round(rng.uniform(0.01, 999), 3), rng.choice([1, 2.5, 3, 7])) for _ in range(300)]
+        subscription = self._create_subscription(self.tax_purchase_a, prices)
+
+        self.assertTrue(subscription.line_ids._is_simple_percent_tax(self.tax_purchase_a))
+        self._assert_compute_all(subscription.line_ids)
+
+    def test_price_included_uses_compute_all(self):
+        tax = self.tax_purchase_a.copy({'price_include_override': 'tax_included'})
+        subscription = self._create_subscription(tax, [(115, 1), (99.99, 3)])
+
+        self.assertFalse(subscription.line_ids._is_simple_percent_tax(tax))
+        self._assert_compute_all(subscription.line_ids)
+
+
+@tagged('post_install', '-at_install', '-standard', 'subscription_benchmark')
+class BenchSubscriptionAmount(SubscriptionAmountCommon):
+    """Mass price edit of 50k lines, with and without the percent fast path.
+
+    Run with ``--test-tags subscription_benchmark``.
+    """
+
+    def test_mass_price_edit(self):
+        rng = random.Random(0)
+        subscription = self._create_subscription(self.tax_purchase_a, [(10, 1)] * 50000)
+        lines = subscription.line_ids
+
+        def edit_prices():
+            for line in lines:
+                line.unit_price = round(rng.uniform(1, 1000), 2)
+            start = time.perf_counter()
+            lines._compute_amount()
+            return time.perf_counter() - start
+
+        fast = edit_prices()
+        with patch.object(type(lines), '_is_simple_percent_tax', lambda self, tax: False):
+            engine = edit_prices()
+
+        _logger.info(
+            "Subscription amounts of %s lines: %.2fs with the percent path, %.2fs with compute_all",
+            len(lines), fast, engine,
+        )
+        self._assert_compute_all(lines[:1000])
+        self.assertLess(fast, engine)